@@ -1,145 +1,398 @@
 import asyncio
 import click
+import contextlib
 import importlib
+import inspect
 import logging
-import multiprocessing
-import sqlite3
+import os
+import pkgutil
+import re
 import sys
+import threading
 import time
 import json
-import traceback
+import copy
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-import collections.abc
-import csv
+from typing import Iterator, NamedTuple
 import hashlib
 import fnmatch
+import functools
 
 import yaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 from integration_framework.integrations import Integration
 from integration_framework.sql_query_manager import SQLQueryManager
 from integration_framework.support_manager import SupportManager
 from integration_framework.telemetry import TelemetryManager
+from integration_framework.utils import configure_logging
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-def _run_integration(integration_name: str, verbose: bool, integrations_dir: Path) -> None:
-    """Run a single integration in a separate process.
+# multiprocessing and sqlite3 are only needed on the parallel and telemetry-lookup
+# paths and are imported where used; setting INTEGRATION_EAGER_IMPORT=1 loads them
+# up front so import problems surface regardless of the code path exercised.
+if os.environ.get("INTEGRATION_EAGER_IMPORT") == "1":
+    import multiprocessing  # noqa: F401
+    import sqlite3  # noqa: F401
+
+if _SafeLoader is yaml.SafeLoader:
+    logger.warning("LibYAML bindings not available; falling back to the pure-Python YAML loader")
+
+def _dumps(obj: object, pretty: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON, using orjson when it is installed.
 
     Args:
-        integration_name (str): Name of the integration.
-        verbose (bool): If True, log detailed output.
-        integrations_dir (Path): Directory containing integrations.
+        obj (object): JSON-serializable object.
+        pretty (bool): If True, indent the output by two spaces.
+
+    Returns:
+        bytes: Encoded JSON.
     """
-    support = SupportManager()
-    telemetry = TelemetryManager("telemetry.db")
-    
-    config_path = integrations_dir / integration_name / "config.yaml"
-    try:
-        with config_path.open() as f:
-            config = yaml.safe_load(f) or {}
-    except FileNotFoundError:
-        logger.warning(f"Config file not found for {integration_name}")
-        return
-    except yaml.YAMLError as e:
-        logger.error(f"Invalid config for {integration_name}: {e}")
-        return
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
 
-    if not config.get("enabled", False):
-        logger.info(f"Integration {integration_name} is disabled")
-        return
+def _loads(data: bytes) -> object:
+    """Deserialize UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        data (bytes): Encoded JSON.
+
+    Returns:
+        object: Decoded object.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+_YAML_CACHE_SIZE = 100
+_yaml_cache: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the hidden JSON sidecar path for a YAML file, e.g. `.config.json`.
+
+    Args:
+        path (Path): Path to the YAML file.
+
+    Returns:
+        Path: Path of the sidecar next to the YAML file.
+    """
+    return path.with_name(f".{path.stem}.json")
+
+def _read_json_sidecar(path: Path, st: os.stat_result) -> dict | None:
+    """Read the JSON sidecar of a YAML file if it was generated from its current contents.
 
-    module_name = f"integration_framework.integrations.{integration_name}"
+    Args:
+        path (Path): Path to the YAML file.
+        st (os.stat_result): Current stat result of the YAML file.
+
+    Returns:
+        dict | None: Parsed data, or None if the sidecar is missing, stale or unreadable.
+    """
     try:
-        module = importlib.import_module(module_name)
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if isinstance(attr, type) and issubclass(attr, Integration) and attr != Integration:
-                integration_class = attr
-                break
-        else:
-            logger.warning(f"No Integration subclass found in {integration_name}")
+        sidecar = _loads(_sidecar_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(sidecar, dict)
+        or sidecar.get("mtime_ns") != st.st_mtime_ns
+        or sidecar.get("size") != st.st_size
+    ):
+        return None
+    return sidecar.get("data")
+
+def _write_json_sidecar(path: Path, st: os.stat_result, data: dict) -> None:
+    """Write a JSON sidecar for a parsed YAML file so later runs can skip the YAML parse.
+
+    Data that does not survive a JSON round trip unchanged (dates, non-string keys)
+    gets no sidecar, and write failures such as a read-only directory are ignored.
+
+    Args:
+        path (Path): Path to the YAML file.
+        st (os.stat_result): Stat result of the YAML file the data was parsed from.
+        data (dict): Parsed YAML content.
+    """
+    try:
+        encoded = _dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data})
+        if _loads(encoded)["data"] != data:
             return
-    except ImportError as e:
-        error_msg = f"Failed to load integration {integration_name}: {str(e)}\n{traceback.format_exc()}"
-        logger.error(error_msg)
+    except (TypeError, ValueError):
         return
-
-    start_time = time.time()
+    sidecar = _sidecar_path(path)
+    tmp_file = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.{threading.get_ident()}.tmp")
     try:
-        integration = integration_class(config, support, integration_name)
-        data = integration.fetch_data()
-        processed_data = integration.postprocess_data(data)
-        integration.deliver_results(processed_data)
-        duration = time.time() - start_time
-        support.notify(f"Completed {integration_name} in {duration:.2f}s")
-        telemetry.log_run(integration_name, "success", duration)
-        if verbose:
-            logger.info(f"Completed {integration_name} in {duration:.2f}s")
-    except Exception as e:
-        duration = time.time() - start_time
-        error_msg = f"Integration {integration_name} failed: {e}"
-        logger.error(error_msg)
-        telemetry.log_run(integration_name, "failed", duration, str(e))
-        if verbose:
-            logger.error(error_msg)
+        tmp_file.write_bytes(encoded)
+        os.replace(tmp_file, sidecar)
+    except OSError as e:
+        logger.debug("Could not write YAML sidecar %s: %s", sidecar, e)
+        tmp_file.unlink(missing_ok=True)
 
-def _run_integration_wrapper(args: tuple[str, bool, Path]) -> None:
-    """Wrapper for multiprocessing to run integrations.
+def _load_yaml(path: Path) -> dict:
+    """Load a YAML file through a small LRU cache validated by modification time and size.
+
+    Each path keeps at most one cached parse; an edited file no longer matches its
+    stat signature and is parsed again. On a miss the file's JSON sidecar is preferred
+    over parsing the YAML. Callers receive a deep copy, so mutating the result never
+    affects the cache.
 
     Args:
-        args (tuple[str, bool, Path]): Integration name, verbose flag, and integrations directory.
+        path (Path): Path to the YAML file.
+
+    Returns:
+        dict: Parsed YAML content, or empty dict if the file is empty.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file is not valid YAML.
     """
-    integration_name, verbose, integrations_dir = args
-    _run_integration(integration_name, verbose, integrations_dir)
+    key = str(path)
+    st = path.stat()
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _yaml_cache.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
+    data = _read_json_sidecar(path, st)
+    if data is None:
+        with path.open() as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
+        _write_json_sidecar(path, st, data)
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        _yaml_cache.move_to_end(key)
+        if len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return copy.deepcopy(data)
+
+# Most filter results kept in the validation cache; the oldest stored is evicted first.
+_FILTER_CACHE_SIZE = 64
+
+# Expected types of well-known config keys, checked before any integration code is
+# imported. Bump _CONFIG_SCHEMA_VERSION whenever the schema changes so validation
+# results cached under the previous rules are discarded.
+_CONFIG_SCHEMA_VERSION = 1
+_CONFIG_SCHEMA: tuple[tuple[str, type], ...] = (
+    ("enabled", bool),
+    ("http_client", dict),
+)
+
+def _check_config(config: object) -> bool:
+    """Check a parsed integration config against the expected key types.
+
+    Args:
+        config (object): Parsed contents of config.yaml.
+
+    Returns:
+        bool: True if the config is a mapping whose known keys have the expected types.
+    """
+    if not isinstance(config, dict):
+        return False
+    for key, expected in _CONFIG_SCHEMA:
+        if key in config and not isinstance(config[key], expected):
+            return False
+    return True
+
+def _truncate(text: str, width: int = 17) -> str:
+    """Shorten text for a table column, marking the cut with an ellipsis.
+
+    Args:
+        text (str): Text to shorten.
+        width (int): Number of characters kept before the ellipsis.
+
+    Returns:
+        str: The text itself, or its first width characters followed by '...'.
+    """
+    return text[:width] + "..." if len(text) > width else text
+
+_LIST_ROW_FORMAT = (
+    "{name:<20} {business_contact:<25} {technical_contact:<25} {last_updated:<20} "
+    "{description:<20} {version:<10} {valid_status!s:<10} {tags:<20}"
+)
+_LIST_HEADER = _LIST_ROW_FORMAT.format(
+    name="Name",
+    business_contact="Business Contact",
+    technical_contact="Technical Contact",
+    last_updated="Last Updated",
+    description="Description",
+    version="Version",
+    valid_status="Valid",
+    tags="Tags"
+)
+
+def _is_integration_class(obj: object) -> bool:
+    """Check whether an object is a concrete Integration subclass.
+
+    Args:
+        obj (object): Attribute fetched from an integration module.
+
+    Returns:
+        bool: True if obj is a subclass of Integration other than Integration itself.
+    """
+    return isinstance(obj, type) and issubclass(obj, Integration) and obj is not Integration
+
+# Stands in for a last-updated bound that is not a valid ISO date; like comparing
+# against the raw string did, it rejects every integration with a known timestamp.
+_INVALID_BOUND = object()
+
+class _IntegrationPaths(NamedTuple):
+    """Filesystem locations of a single integration."""
+    dir: Path
+    config: Path
+    metadata: Path
+    init: Path
+
+@functools.lru_cache(maxsize=1024)
+def _integration_paths(integrations_dir: Path, integration_name: str) -> _IntegrationPaths:
+    """Build the paths of an integration's files once per directory and name.
+
+    Args:
+        integrations_dir (Path): Directory containing integrations.
+        integration_name (str): Name of the integration.
+
+    Returns:
+        _IntegrationPaths: Paths of the integration directory and its files.
+    """
+    integration_dir = integrations_dir / integration_name
+    return _IntegrationPaths(
+        integration_dir,
+        integration_dir / "config.yaml",
+        integration_dir / "metadata.yaml",
+        integration_dir / "__init__.py"
+    )
+
+_RUNNER: "BatchRunner | None" = None
+
+def _worker_init(integrations_dir: Path, is_test: bool, class_cache: dict[str, type[Integration]]) -> None:
+    """Create the BatchRunner used by a process pool worker.
+
+    Runs once per worker process, so integration classes resolved here or inherited
+    from the parent are reused for every task the worker executes.
+
+    Args:
+        integrations_dir (Path): Directory containing integrations.
+        is_test (bool): Whether integrations are loaded from the test package.
+        class_cache (dict[str, type[Integration]]): Integration classes already loaded by the parent.
+    """
+    global _RUNNER
+    _RUNNER = BatchRunner()
+    _RUNNER.integrations_dir = integrations_dir
+    _RUNNER._is_test = is_test
+    _RUNNER._class_cache.update(class_cache)
+
+def _run_in_worker(integration_name: str, verbose: bool) -> tuple[str, str, float, str, str | None] | None:
+    """Run a single integration in a process pool worker.
+
+    Args:
+        integration_name (str): Name of the integration.
+        verbose (bool): If True, log detailed output.
+
+    Returns:
+        tuple[str, str, float, str, str | None] | None: Telemetry row for the parent to log.
+    """
+    return _RUNNER.run_integration(integration_name, verbose, log_telemetry=False)
 
 class BatchRunner:
     """Manages batch processing of integrations.
 
     Provides methods to load, run, validate, and filter integrations, with support for parallel execution using asyncio or multiprocessing.
     """
-    def __init__(self) -> None:
-        """Initialize the BatchRunner with integration directory and managers."""
+    def __init__(self, pretty_cache: bool = False) -> None:
+        """Initialize the BatchRunner with integration directory and managers.
+
+        Args:
+            pretty_cache (bool): If True, write the validation cache as indented JSON.
+        """
         self.integrations_dir = Path(__file__).parent / "integrations"
         self.support = SupportManager()
         self.sql_manager = SQLQueryManager("telemetry.db")
         self.telemetry = TelemetryManager("telemetry.db")
         self.cache_file = Path("validation_cache.json")
         self.cache_ttl = timedelta(hours=24)
+        self.pretty_cache = pretty_cache
         self._is_test = False
+        self._class_cache: dict[str, type[Integration]] = {}
+        self._cache: dict | None = None
+        self._cache_hash: bytes | None = None
+        self._cache_base: dict = {}
+        self._cache_stat: tuple[int, int] | None = None
+        self._cache_mutex = threading.Lock()
+        self._integration_stats: dict[str, os.stat_result] | None = None
+        self._available_modules: frozenset[str] | None = None
+
+    @property
+    def available_modules(self) -> frozenset[str]:
+        """Names of the importable integration packages, discovered once per runner."""
+        if self._available_modules is None:
+            self._available_modules = frozenset(
+                module.name for module in pkgutil.iter_modules([str(self.integrations_dir)]) if module.ispkg
+            )
+        return self._available_modules
 
     def load_integration(self, integration_name: str) -> type[Integration] | None:
         """Load an integration class by name.
 
+        The module's `INTEGRATION_CLASS` attribute is used when it exports one, then
+        the class named by `class_name` in the integration's metadata; otherwise the
+        module is scanned for an Integration subclass.
+
         Args:
             integration_name (str): Name of the integration to load.
 
         Returns:
             type[Integration] | None: The integration class if found, else None.
         """
+        if integration_name in self._class_cache:
+            return self._class_cache[integration_name]
         package_prefix = "test_integration_framework" if self._is_test else "integration_framework"
         module_name = f"{package_prefix}.integrations.{integration_name}"
+        if integration_name not in self.available_modules:
+            logger.warning(f"Module {module_name} not found")
+            return None
         try:
-            spec = importlib.util.find_spec(module_name)
-            if spec is None:
-                logger.warning(f"Module {module_name} not found")
-                try:
-                    module = importlib.import_module(module_name)
-                except ImportError as e:
-                    logger.error(f"Fallback import failed for {module_name}: {str(e)}")
-                    return None
-            else:
-                module = importlib.import_module(module_name)
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+            attr = getattr(module, "INTEGRATION_CLASS", None)
+            if _is_integration_class(attr):
+                self._class_cache[integration_name] = attr
+                return attr
+            class_name = self.load_metadata(integration_name).get("class_name")
+            if class_name:
+                attr = getattr(module, class_name, None)
+                if _is_integration_class(attr):
+                    self._class_cache[integration_name] = attr
+                    return attr
+                logger.warning(f"Class {class_name} in {integration_name} is not an Integration subclass")
+                return None
             for attr_name in dir(module):
                 attr = getattr(module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, Integration) and attr != Integration:
+                if _is_integration_class(attr):
+                    self._class_cache[integration_name] = attr
                     return attr
             logger.warning(f"No Integration subclass found in {integration_name}")
             return None
         except ImportError as e:
-            error_msg = f"Failed to load integration {integration_name}: {str(e)}\n{traceback.format_exc()}"
-            logger.error(error_msg)
+            logger.error("Failed to load integration %s: %s", integration_name, e)
+            logger.debug("Traceback for %s", integration_name, exc_info=True)
             return None
 
     def load_config(self, integration_name: str) -> dict:
@@ -151,10 +404,9 @@ class BatchRunner:
         Returns:
             dict: Configuration dictionary, or empty dict if not found or invalid.
         """
-        config_path = self.integrations_dir / integration_name / "config.yaml"
+        config_path = _integration_paths(self.integrations_dir, integration_name).config
         try:
-            with config_path.open() as f:
-                return yaml.safe_load(f) or {}
+            return _load_yaml(config_path)
         except FileNotFoundError:
             logger.warning(f"Config file not found for {integration_name}")
             return {}
@@ -171,10 +423,9 @@ class BatchRunner:
         Returns:
             dict: Metadata dictionary, or empty dict if not found or invalid.
         """
-        metadata_path = self.integrations_dir / integration_name / "metadata.yaml"
+        metadata_path = _integration_paths(self.integrations_dir, integration_name).metadata
         try:
-            with metadata_path.open() as f:
-                return yaml.safe_load(f) or {}
+            return _load_yaml(metadata_path)
         except FileNotFoundError:
             logger.warning(f"Metadata file not found for {integration_name}")
             return {}
@@ -191,8 +442,7 @@ class BatchRunner:
         if not self.cache_file.exists():
             return {"integrations": {}}
         try:
-            with self.cache_file.open() as f:
-                return json.load(f) or {"integrations": {}}
+            return _loads(self.cache_file.read_bytes()) or {"integrations": {}}
         except json.JSONDecodeError as e:
             logger.error(f"Failed to load validation cache: {e}")
             return {"integrations": {}}
@@ -203,11 +453,164 @@ class BatchRunner:
         Args:
             cache (dict): Validation cache data to save.
         """
+        self._write_cache(self._serialize_cache(cache))
+
+    def _serialize_cache(self, cache: dict) -> bytes:
+        """Serialize validation cache data, compact unless pretty_cache is set.
+
+        Args:
+            cache (dict): Validation cache data.
+
+        Returns:
+            bytes: UTF-8 encoded JSON.
+        """
+        return _dumps(cache, pretty=self.pretty_cache)
+
+    def _write_cache(self, data: bytes) -> bool:
+        """Atomically replace the validation cache file.
+
+        The data is written to a temporary file next to the cache and swapped in with
+        os.replace, so concurrent readers never see a partially written file.
+
+        Args:
+            data (bytes): Serialized validation cache.
+
+        Returns:
+            bool: True if the file was written.
+        """
+        tmp_file = self.cache_file.with_name(f".{self.cache_file.name}.{os.getpid()}.tmp")
         try:
-            with self.cache_file.open("w") as f:
-                json.dump(cache, f, indent=2)
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.cache_file)
+            return True
         except Exception as e:
             logger.error(f"Failed to save validation cache: {e}")
+            return False
+
+    @property
+    def validation_cache(self) -> dict:
+        """Validation cache, loaded from file on first access and kept in memory.
+
+        If another process rewrites the file, its contents are picked up on the next
+        access, with this runner's unsaved changes applied on top.
+        """
+        with self._cache_mutex:
+            return self._load_or_refresh_cache()
+
+    def _load_or_refresh_cache(self) -> dict:
+        """Load the validation cache, or refresh it if the file changed on disk.
+
+        Returns:
+            dict: The in-memory validation cache.
+        """
+        signature = self._cache_file_signature()
+        if self._cache is None:
+            self._cache_stat = signature
+            self._cache = self.load_validation_cache()
+            self._cache_base = copy.deepcopy(self._cache)
+            self._cache_hash = hashlib.blake2b(self._serialize_cache(self._cache), digest_size=16).digest()
+        elif signature != self._cache_stat:
+            self._cache_stat = signature
+            self._merge_disk_cache()
+            self._cache_hash = hashlib.blake2b(self._serialize_cache(self._cache_base), digest_size=16).digest()
+        return self._cache
+
+    def _cache_file_signature(self) -> tuple[int, int] | None:
+        """Get the modification time and size of the cache file.
+
+        Returns:
+            tuple[int, int] | None: (mtime_ns, size), or None if the file does not exist.
+        """
+        try:
+            st = self.cache_file.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    @contextlib.contextmanager
+    def _cache_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the validation cache while it is merged and written.
+
+        Locking needs fcntl and a writable cache directory; without them the block
+        runs unlocked.
+        """
+        lock_file = None
+        if fcntl is not None:
+            try:
+                lock_file = self.cache_file.with_name(f".{self.cache_file.name}.lock").open("a")
+            except OSError:
+                lock_file = None
+        if lock_file is None:
+            yield
+            return
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _merge_disk_cache(self) -> None:
+        """Merge this runner's cache changes into the current on-disk cache.
+
+        Entries that differ from what was loaded are applied on top of the file's
+        current contents, so entries written by other processes in the meantime are kept.
+        """
+        disk = self.load_validation_cache()
+        merged = copy.deepcopy(disk)
+        for section, entries in self._cache.items():
+            base_entries = self._cache_base.get(section)
+            if isinstance(entries, dict) and isinstance(merged.get(section), dict):
+                if not isinstance(base_entries, dict):
+                    base_entries = {}
+                for key, value in entries.items():
+                    if base_entries.get(key) != value:
+                        merged[section][key] = value
+            elif entries != base_entries:
+                merged[section] = entries
+        self._cache = merged
+        self._cache_base = disk
+
+    def flush_cache(self) -> None:
+        """Write the in-memory validation cache to file if it changed since it was loaded.
+
+        If another process rewrote the file in the meantime, the changes are merged
+        into its current contents instead of overwriting them.
+        """
+        with self._cache_mutex:
+            if self._cache is None:
+                return
+            data = self._serialize_cache(self._cache)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest == self._cache_hash:
+                return
+            with self._cache_lock():
+                if self._cache_file_signature() != self._cache_stat:
+                    self._merge_disk_cache()
+                    data = self._serialize_cache(self._cache)
+                    digest = hashlib.blake2b(data, digest_size=16).digest()
+                if self._write_cache(data):
+                    self._cache_hash = digest
+                    self._cache_base = copy.deepcopy(self._cache)
+                    self._cache_stat = self._cache_file_signature()
+
+    @property
+    def _sql(self) -> SQLQueryManager:
+        """SQLQueryManager: The runner's SQL manager, connected on first use and kept open until close()."""
+        if self.sql_manager.connection is None:
+            self.sql_manager.__enter__()
+        return self.sql_manager
+
+    def close(self) -> None:
+        """Close the runner's database connection and write any queued telemetry."""
+        if self.sql_manager.connection is not None:
+            self.sql_manager.__exit__(None, None, None)
+        self.telemetry.close()
+
+    def __del__(self) -> None:
+        """Close the database connection when the runner is garbage collected."""
+        if "sql_manager" in self.__dict__ and "telemetry" in self.__dict__:
+            self.close()
 
     def get_last_updated(self, integration_name: str) -> str:
         """Get the last updated timestamp for an integration.
@@ -218,43 +621,112 @@ class BatchRunner:
         Returns:
             str: ISO timestamp or 'N/A' if not available.
         """
+        import sqlite3
+
         query = """
-            SELECT MAX(timestamp)
+            SELECT MAX(timestamp) AS ts
             FROM telemetry
             WHERE integration_name = ?
         """
         try:
-            with self.sql_manager as sql:
-                result = sql.execute_query(query, [integration_name])
-                timestamp = next(result, {}).get("MAX(timestamp)")
-                if timestamp:
-                    return timestamp
+            timestamp = self._sql.fetch_scalar(query, [integration_name])
+            if timestamp:
+                return timestamp
+        except sqlite3.Error:
+            pass
+        return self._fallback_last_updated(integration_name)
+
+    def get_last_updated_bulk(
+        self,
+        integration_names: list[str],
+        metadata_map: dict[str, dict] | None = None
+    ) -> dict[str, str]:
+        """Get the last updated timestamps for several integrations with a single query.
+
+        Args:
+            integration_names (list[str]): Names of the integrations.
+            metadata_map (dict[str, dict] | None): Already loaded metadata by integration
+                name, used for the fallback instead of reading the files again.
+
+        Returns:
+            dict[str, str]: ISO timestamp or 'N/A' for each integration name.
+        """
+        import sqlite3
+
+        last_runs = {}
+        try:
+            # Stay below SQLite's historical limit of 999 bound parameters per statement.
+            for start in range(0, len(integration_names), 900):
+                batch = integration_names[start:start + 900]
+                query = f"""
+                    SELECT integration_name, MAX(timestamp) AS last_run
+                    FROM telemetry
+                    WHERE integration_name IN ({", ".join("?" * len(batch))})
+                    GROUP BY integration_name
+                """
+                for row in self._sql.execute_query(query, batch):
+                    last_runs[row["integration_name"]] = row["last_run"]
         except sqlite3.Error:
             pass
+        return {
+            name: last_runs.get(name) or self._fallback_last_updated(
+                name, metadata_map.get(name) if metadata_map is not None else None
+            )
+            for name in integration_names
+        }
 
-        metadata = self.load_metadata(integration_name)
+    def _fallback_last_updated(self, integration_name: str, metadata: dict | None = None) -> str:
+        """Get the last updated timestamp from metadata or the integration directory.
+
+        Args:
+            integration_name (str): Name of the integration.
+            metadata (dict | None): Already loaded metadata, if available.
+
+        Returns:
+            str: ISO timestamp or 'N/A' if not available.
+        """
+        if metadata is None:
+            metadata = self.load_metadata(integration_name)
         if "last_updated" in metadata:
             return metadata["last_updated"]
-        
-        integration_dir = self.integrations_dir / integration_name
-        if integration_dir.exists():
-            return datetime.fromtimestamp(integration_dir.stat().st_mtime).isoformat()
-        return "N/A"
 
-    def validate_integration(self, integration_name: str) -> bool:
+        dir_stat = (self._integration_stats or {}).get(integration_name)
+        if dir_stat is None:
+            try:
+                dir_stat = _integration_paths(self.integrations_dir, integration_name).dir.stat()
+            except FileNotFoundError:
+                return "N/A"
+        return datetime.fromtimestamp(dir_stat.st_mtime).isoformat()
+
+    def validate_integration(self, integration_name: str, deep: bool = True) -> bool:
         """Validate an integration's configuration and class.
 
+        A deep validation imports the integration and instantiates its class, and its
+        result is stored in the validation cache. A shallow validation only checks the
+        configuration and package layout without executing integration code; it reuses
+        a fresh cached deep result when one exists but is never cached itself.
+
         Args:
             integration_name (str): Name of the integration.
+            deep (bool): If True, import and instantiate the integration class.
 
         Returns:
             bool: True if valid, False otherwise.
         """
-        cache = self.load_validation_cache()
-        integrations_cache = cache.get("integrations", {})
-        
-        if integration_name in integrations_cache:
-            cached = integrations_cache[integration_name]
+        try:
+            config_mtime_ns = _integration_paths(self.integrations_dir, integration_name).config.stat().st_mtime_ns
+        except FileNotFoundError:
+            config_mtime_ns = None
+
+        # validate() calls this from worker threads, and any access may replace the
+        # in-memory cache with a merged copy, so look up and store entries under the mutex.
+        with self._cache_mutex:
+            cached = self._load_or_refresh_cache().get("integrations", {}).get(integration_name)
+        if (
+            cached is not None
+            and cached.get("config_mtime_ns") == config_mtime_ns
+            and cached.get("schema_version") == _CONFIG_SCHEMA_VERSION
+        ):
             try:
                 cache_time = datetime.fromisoformat(cached["timestamp"])
                 if datetime.now() - cache_time < self.cache_ttl:
@@ -263,7 +735,17 @@ class BatchRunner:
                 pass
 
         config = self.load_config(integration_name)
-        if not config.get("enabled", False):
+        config_ok = _check_config(config)
+        if not deep:
+            if not config_ok:
+                return False
+            if not config.get("enabled", False):
+                return True
+            return _integration_paths(self.integrations_dir, integration_name).init.is_file()
+
+        if not config_ok:
+            valid = False
+        elif not config.get("enabled", False):
             valid = True
         else:
             integration_class = self.load_integration(integration_name)
@@ -276,69 +758,180 @@ class BatchRunner:
                 except Exception:
                     valid = False
 
-        integrations_cache[integration_name] = {
+        entry = {
             "valid": valid,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(),
+            "config_mtime_ns": config_mtime_ns,
+            "schema_version": _CONFIG_SCHEMA_VERSION
         }
-        cache["integrations"] = integrations_cache
-        self.save_validation_cache(cache)
+        with self._cache_mutex:
+            self._load_or_refresh_cache().setdefault("integrations", {})[integration_name] = entry
         return valid
 
-    def run_integration(self, integration_name: str, verbose: bool = False) -> None:
-        """Run a single integration.
+    def _load_runnable(self, integration_name: str) -> tuple[dict, type[Integration]] | None:
+        """Load the config and class of an integration that is enabled.
 
         Args:
             integration_name (str): Name of the integration.
-            verbose (bool): If True, log detailed output.
+
+        Returns:
+            tuple[dict, type[Integration]] | None: Config and integration class, or None
+            if the integration is disabled or could not be loaded.
         """
         config = self.load_config(integration_name)
         if not config.get("enabled", False):
             logger.info(f"Integration {integration_name} is disabled")
-            return
+            return None
 
         integration_class = self.load_integration(integration_name)
         if not integration_class:
-            return
+            return None
+        return config, integration_class
+
+    def _record_run(
+        self,
+        integration_name: str,
+        start_time: float,
+        error: Exception | None,
+        verbose: bool,
+        log_telemetry: bool
+    ) -> tuple[str, str, float, str, str | None]:
+        """Report the outcome of an integration run and build its telemetry row.
+
+        Args:
+            integration_name (str): Name of the integration.
+            start_time (float): time.time() at the start of the run.
+            error (Exception | None): Exception raised by the run, if any.
+            verbose (bool): If True, log detailed output.
+            log_telemetry (bool): If True, write the telemetry row immediately.
+
+        Returns:
+            tuple[str, str, float, str, str | None]: Telemetry row of
+            (integration_name, status, duration, timestamp, error).
+        """
+        duration = time.time() - start_time
+        if error is None:
+            self.support.notify(f"Completed {integration_name} in {duration:.2f}s")
+            row = (integration_name, "success", duration, datetime.now().isoformat(), None)
+            if verbose:
+                logger.info(f"Completed {integration_name} in {duration:.2f}s")
+        else:
+            error_msg = f"Integration {integration_name} failed: {error}"
+            logger.error(error_msg)
+            row = (integration_name, "failed", duration, datetime.now().isoformat(), str(error))
+            if verbose:
+                logger.error(error_msg)
+        if log_telemetry:
+            self.telemetry.log_run(integration_name, row[1], row[2], row[4])
+        return row
+
+    def run_integration(
+        self,
+        integration_name: str,
+        verbose: bool = False,
+        log_telemetry: bool = True
+    ) -> tuple[str, str, float, str, str | None] | None:
+        """Run a single integration.
+
+        A coroutine returned by fetch_data is run to completion on a private event loop.
+
+        Args:
+            integration_name (str): Name of the integration.
+            verbose (bool): If True, log detailed output.
+            log_telemetry (bool): If True, write the telemetry row immediately; batch
+                callers pass False and log the returned rows together.
+
+        Returns:
+            tuple[str, str, float, str, str | None] | None: Telemetry row of
+            (integration_name, status, duration, timestamp, error), or None if the
+            integration is disabled or could not be loaded.
+        """
+        runnable = self._load_runnable(integration_name)
+        if runnable is None:
+            return None
+        config, integration_class = runnable
 
         start_time = time.time()
+        error = None
         try:
             integration = integration_class(config, self.support, integration_name)
             data = integration.fetch_data()
+            if inspect.iscoroutine(data):
+                data = asyncio.run(data)
             processed_data = integration.postprocess_data(data)
             integration.deliver_results(processed_data)
-            duration = time.time() - start_time
-            self.support.notify(f"Completed {integration_name} in {duration:.2f}s")
-            self.telemetry.log_run(integration_name, "success", duration)
-            if verbose:
-                logger.info(f"Completed {integration_name} in {duration:.2f}s")
         except Exception as e:
-            duration = time.time() - start_time
-            error_msg = f"Integration {integration_name} failed: {e}"
-            logger.error(error_msg)
-            self.telemetry.log_run(integration_name, "failed", duration, str(e))
-            if verbose:
-                logger.error(error_msg)
+            error = e
+        return self._record_run(integration_name, start_time, error, verbose, log_telemetry)
 
-    async def run_integration_async(self, integration_name: str, verbose: bool = False) -> None:
+    async def run_integration_async(
+        self,
+        integration_name: str,
+        verbose: bool = False,
+        log_telemetry: bool = True
+    ) -> tuple[str, str, float, str, str | None] | None:
         """Run a single integration asynchronously.
 
+        Integrations providing a coroutine `fetch_data_async` or `fetch_data` are awaited
+        on the running event loop; blocking fetches are offloaded to a worker thread,
+        as are post-processing, delivery and the completion notice, so gathered
+        integrations overlap their I/O.
+
         Args:
             integration_name (str): Name of the integration.
             verbose (bool): If True, log detailed output.
+            log_telemetry (bool): If True, write the telemetry row immediately.
+
+        Returns:
+            tuple[str, str, float, str, str | None] | None: Telemetry row, as returned by run_integration.
         """
-        self.run_integration(integration_name, verbose)
+        runnable = self._load_runnable(integration_name)
+        if runnable is None:
+            return None
+        config, integration_class = runnable
+
+        start_time = time.time()
+        error = None
+        try:
+            integration = integration_class(config, self.support, integration_name)
+            fetch_async = getattr(integration, "fetch_data_async", None)
+            if inspect.iscoroutinefunction(fetch_async):
+                data = await fetch_async()
+            elif inspect.iscoroutinefunction(integration.fetch_data):
+                data = await integration.fetch_data()
+            else:
+                data = await asyncio.to_thread(integration.fetch_data)
+            await asyncio.to_thread(
+                lambda: integration.deliver_results(integration.postprocess_data(data))
+            )
+        except Exception as e:
+            error = e
+        # The completion notice can block in log_with_backoff, so keep it off the loop.
+        return await asyncio.to_thread(
+            self._record_run, integration_name, start_time, error, verbose, log_telemetry
+        )
 
     def get_integrations(self) -> list[str]:
         """Get a list of available integration names.
 
+        The directory is scanned once per runner; the stat result of each integration
+        directory is kept for later last-updated lookups.
+
         Returns:
             list[str]: List of integration directory names.
         """
-        return [
-            d.name
-            for d in self.integrations_dir.iterdir()
-            if d.is_dir() and (d / "__init__.py").exists() and (d / "config.yaml").exists()
-        ]
+        if self._integration_stats is None:
+            stats = {}
+            with os.scandir(self.integrations_dir) as entries:
+                for entry in entries:
+                    if (
+                        entry.is_dir(follow_symlinks=False)
+                        and os.path.isfile(os.path.join(entry.path, "__init__.py"))
+                        and os.path.isfile(os.path.join(entry.path, "config.yaml"))
+                    ):
+                        stats[entry.name] = entry.stat(follow_symlinks=False)
+            self._integration_stats = stats
+        return list(self._integration_stats)
 
     def filter_integrations(
         self,
@@ -366,8 +959,6 @@ class BatchRunner:
         Returns:
             tuple[list[str], str]: Filtered integration names and criteria hash.
         """
-        integrations = self.get_integrations()
-        filtered = []
         criteria = {
             "name": name,
             "partial_name": partial_name,
@@ -378,44 +969,200 @@ class BatchRunner:
             "last_updated_after": last_updated_after,
             "description_contains": description_contains
         }
+        criteria_hash = self._criteria_hash(criteria)
+        cached = self._cached_filter(criteria_hash, criteria)
+        if cached is not None:
+            return cached, criteria_hash
+
+        prepared = self._prepare_criteria(criteria)
+        integrations = self._candidate_integrations(prepared)
+        metadata_map = {name: self.load_metadata(name) for name in integrations}
+        last_updated_map = self.get_last_updated_bulk(integrations, metadata_map)
+        filtered = [
+            integration_name
+            for integration_name in integrations
+            if self._matches(metadata_map[integration_name], last_updated_map[integration_name], prepared)
+        ]
+        self._store_filter(criteria_hash, criteria, filtered)
+        return filtered, criteria_hash
+
+    def _filter_token(self, criteria: dict) -> str | None:
+        """Fingerprint the inputs a filter result depends on.
+
+        The token covers the set of integrations and the modification time of each
+        metadata file. Results of date-bounded criteria also depend on telemetry and
+        are never reused, so they get no token.
+
+        Args:
+            criteria (dict): Filter criteria keyed by option name.
+
+        Returns:
+            str | None: Hex digest, or None if the result must not be reused.
+        """
+        if criteria["last_updated_before"] or criteria["last_updated_after"]:
+            return None
+        parts = []
+        for integration_name in sorted(self.get_integrations()):
+            try:
+                mtime_ns = _integration_paths(self.integrations_dir, integration_name).metadata.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+            parts.append(f"{integration_name}:{mtime_ns}")
+        return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+    def _cached_filter(self, criteria_hash: str, criteria: dict) -> list[str] | None:
+        """Get a persisted filter result that is still valid.
+
+        Args:
+            criteria_hash (str): Hash of the criteria.
+            criteria (dict): Filter criteria keyed by option name.
+
+        Returns:
+            list[str] | None: Matching integration names, or None on a miss.
+        """
+        cached = self.validation_cache.get("filters", {}).get(criteria_hash)
+        if not cached or cached.get("token") is None:
+            return None
+        if cached["token"] != self._filter_token(criteria):
+            return None
+        return list(cached["integrations"])
+
+    def _store_filter(self, criteria_hash: str, criteria: dict, integrations: list[str]) -> None:
+        """Persist a filter result and its criteria in the validation cache.
+
+        The criteria are kept even when the result cannot be reused, so that
+        `run --criteria-hash` can resolve a hash printed by `list`; only the result
+        itself is dropped. At most _FILTER_CACHE_SIZE filters are kept, and storing
+        one moves it to the end of the eviction order.
+
+        Args:
+            criteria_hash (str): Hash of the criteria.
+            criteria (dict): Filter criteria keyed by option name.
+            integrations (list[str]): Matching integration names.
+        """
+        token = self._filter_token(criteria)
+        if token is None:
+            entry = {"criteria": criteria}
+        else:
+            entry = {"criteria": criteria, "token": token, "integrations": integrations}
+        with self._cache_mutex:
+            filters = self._load_or_refresh_cache().setdefault("filters", {})
+            filters.pop(criteria_hash, None)
+            filters[criteria_hash] = entry
+            while len(filters) > _FILTER_CACHE_SIZE:
+                del filters[next(iter(filters))]
+
+    @staticmethod
+    def _criteria_hash(criteria: dict) -> str:
+        """Compute a short, stable hash of filter criteria.
+
+        Args:
+            criteria (dict): Filter criteria keyed by option name.
+
+        Returns:
+            str: First 8 hex digits of the SHA-256 of the sorted criteria JSON.
+        """
         criteria_json = json.dumps(criteria, sort_keys=True)
-        criteria_hash = hashlib.sha256(criteria_json.encode()).hexdigest()[:8]
+        return hashlib.sha256(criteria_json.encode()).hexdigest()[:8]
 
-        for integration_name in integrations:
-            metadata = self.load_metadata(integration_name)
-            config = self.load_config(integration_name)
-            last_updated = self.get_last_updated(integration_name)
-
-            if name and integration_name != name:
-                continue
-            if partial_name and not fnmatch.fnmatch(integration_name, f"*{partial_name}*"):
-                continue
-            if tags:
-                integration_tags = metadata.get("tags", [])
-                if not all(tag in integration_tags for tag in tags):
-                    continue
-            if business_contact and metadata.get("business_contact") != business_contact:
-                continue
-            if technical_contact and metadata.get("technical_contact") != technical_contact:
-                continue
-            if last_updated_before:
-                try:
-                    if last_updated != "N/A" and datetime.fromisoformat(last_updated) > datetime.fromisoformat(last_updated_before):
-                        continue
-                except ValueError:
-                    continue
-            if last_updated_after:
-                try:
-                    if last_updated == "N/A" or datetime.fromisoformat(last_updated) < datetime.fromisoformat(last_updated_after):
-                        continue
-                except ValueError:
-                    continue
-            if description_contains and description_contains.lower() not in metadata.get("description", "").lower():
-                continue
+    @staticmethod
+    def _prepare_criteria(criteria: dict) -> dict:
+        """Precompute matchers for filter criteria once per filtering call.
 
-            filtered.append(integration_name)
+        The partial-name wildcard is compiled to a regex, tags become a set, the
+        description substring is lowercased and the date bounds are parsed, so the
+        per-integration checks do no repeated parsing.
 
-        return filtered, criteria_hash
+        Args:
+            criteria (dict): Filter criteria keyed by option name.
+
+        Returns:
+            dict: Prepared criteria, with None for every criterion that is not set.
+        """
+        def parse_bound(value: str | None) -> datetime | object | None:
+            if not value:
+                return None
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                return _INVALID_BOUND
+
+        partial_name = criteria["partial_name"]
+        description_contains = criteria["description_contains"]
+        return {
+            "name": criteria["name"] or None,
+            "partial_name": re.compile(fnmatch.translate(f"*{partial_name}*")).match if partial_name else None,
+            "tags": set(criteria["tags"]) if criteria["tags"] else None,
+            "business_contact": criteria["business_contact"] or None,
+            "technical_contact": criteria["technical_contact"] or None,
+            "last_updated_before": parse_bound(criteria["last_updated_before"]),
+            "last_updated_after": parse_bound(criteria["last_updated_after"]),
+            "description_contains": description_contains.lower() if description_contains else None
+        }
+
+    def _candidate_integrations(self, prepared: dict) -> list[str]:
+        """Get the integrations whose names satisfy the prepared name criteria.
+
+        Name checks run before any metadata is read, and an exact name is looked up
+        directly instead of being compared against every integration.
+
+        Args:
+            prepared (dict): Criteria returned by _prepare_criteria.
+
+        Returns:
+            list[str]: Names of the candidate integrations.
+        """
+        integrations = self.get_integrations()
+        if prepared["name"]:
+            integrations = [prepared["name"]] if prepared["name"] in self._integration_stats else []
+        if prepared["partial_name"]:
+            integrations = [name for name in integrations if prepared["partial_name"](name)]
+        return integrations
+
+    @staticmethod
+    def _matches(metadata: dict, last_updated: str, prepared: dict) -> bool:
+        """Check whether an integration's metadata satisfies the filter criteria.
+
+        Name criteria are applied beforehand by _candidate_integrations.
+
+        Args:
+            metadata (dict): Metadata of the integration.
+            last_updated (str): Last updated timestamp or 'N/A'.
+            prepared (dict): Criteria returned by _prepare_criteria.
+
+        Returns:
+            bool: True if every given criterion matches.
+        """
+        tags = prepared["tags"]
+        if tags and not tags.issubset(metadata.get("tags", [])):
+            return False
+        business_contact = prepared["business_contact"]
+        if business_contact and metadata.get("business_contact") != business_contact:
+            return False
+        technical_contact = prepared["technical_contact"]
+        if technical_contact and metadata.get("technical_contact") != technical_contact:
+            return False
+        before = prepared["last_updated_before"]
+        after = prepared["last_updated_after"]
+        if before is not None or after is not None:
+            if last_updated == "N/A":
+                if after is not None:
+                    return False
+            else:
+                try:
+                    last_updated_dt = datetime.fromisoformat(last_updated)
+                except ValueError:
+                    return False
+                if before is _INVALID_BOUND or after is _INVALID_BOUND:
+                    return False
+                if before is not None and last_updated_dt > before:
+                    return False
+                if after is not None and last_updated_dt < after:
+                    return False
+        description_contains = prepared["description_contains"]
+        if description_contains and description_contains not in metadata.get("description", "").lower():
+            return False
+        return True
 
     async def run_filtered(
         self,
@@ -442,29 +1189,66 @@ class BatchRunner:
             last_updated_before (str | None): Last updated before (YYYY-MM-DD).
             last_updated_after (str | None): Last updated after (YYYY-MM-DD).
             description_contains (str | None): Substring in description.
-            criteria_hash (str | None): Criteria hash for filtering.
+            criteria_hash (str | None): Criteria hash printed by `list`; used alone, it selects the
+                stored criteria for that hash.
             verbose (bool): If True, log detailed output.
             parallel (str): Parallelism mode ('none', 'asyncio', 'multiprocessing').
         """
+        criteria = {
+            "name": name,
+            "partial_name": partial_name,
+            "tags": tags,
+            "business_contact": business_contact,
+            "technical_contact": technical_contact,
+            "last_updated_before": last_updated_before,
+            "last_updated_after": last_updated_after,
+            "description_contains": description_contains
+        }
         if criteria_hash:
             logger.info(f"Running integrations with criteria hash: {criteria_hash}")
-        integrations, _ = self.filter_integrations(
-            name, partial_name, tags, business_contact, technical_contact,
-            last_updated_before, last_updated_after, description_contains
-        )
+            if not any(criteria.values()):
+                stored = self.validation_cache.get("filters", {}).get(criteria_hash)
+                if stored is None:
+                    logger.warning(f"Unknown criteria hash: {criteria_hash}")
+                    return
+                criteria = stored["criteria"]
+        integrations, _ = self.filter_integrations(**criteria)
+        self.flush_cache()
         if not integrations:
             logger.warning("No integrations match the specified criteria")
             return
 
         if parallel == "asyncio":
-            tasks = [self.run_integration_async(name, verbose) for name in integrations]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [self.run_integration_async(name, verbose, log_telemetry=False) for name in integrations]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         elif parallel == "multiprocessing":
-            with multiprocessing.Pool() as pool:
-                pool.map(_run_integration_wrapper, [(name, verbose, self.integrations_dir) for name in integrations])
-        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            # Import enabled integrations before the workers start so forked workers
+            # share the already-imported modules instead of importing them again.
             for name in integrations:
-                self.run_integration(name, verbose)
+                if self.load_config(name).get("enabled", False):
+                    self.load_integration(name)
+            # fork is only requested on Linux; on macOS it is unsafe with system
+            # frameworks, and Windows only supports spawn.
+            mp_context = multiprocessing.get_context("fork") if sys.platform == "linux" else None
+            with ProcessPoolExecutor(
+                max_workers=min(len(integrations), os.cpu_count() or 1),
+                mp_context=mp_context,
+                initializer=_worker_init,
+                initargs=(self.integrations_dir, self._is_test, self._class_cache)
+            ) as executor:
+                futures = [executor.submit(_run_in_worker, name, verbose) for name in integrations]
+                results = [future.result() for future in as_completed(futures)]
+        else:
+            # Await one integration at a time on this loop; run_integration would try to
+            # start a nested event loop for coroutine fetches.
+            results = [
+                await self.run_integration_async(name, verbose, log_telemetry=False)
+                for name in integrations
+            ]
+        self.telemetry.log_run_many([row for row in results if isinstance(row, tuple)])
 
     def list_integrations(
         self,
@@ -493,52 +1277,103 @@ class BatchRunner:
             order_by (str): Field to order by ('name', 'last_updated').
             order (str): Order direction ('asc', 'desc').
         """
-        integrations, criteria_hash = self.filter_integrations(
-            name, partial_name, tags, business_contact, technical_contact,
-            last_updated_before, last_updated_after, description_contains
-        )
-        if not integrations:
+        criteria = {
+            "name": name,
+            "partial_name": partial_name,
+            "tags": tags,
+            "business_contact": business_contact,
+            "technical_contact": technical_contact,
+            "last_updated_before": last_updated_before,
+            "last_updated_after": last_updated_after,
+            "description_contains": description_contains
+        }
+        criteria_hash = self._criteria_hash(criteria)
+        prepared = self._prepare_criteria(criteria)
+        integrations = self._candidate_integrations(prepared)
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            metadata_map = dict(zip(integrations, executor.map(self.load_metadata, integrations)))
+            last_updated_map = self.get_last_updated_bulk(integrations, metadata_map)
+            rows = executor.map(
+                functools.partial(self._collect_row, prepared=prepared),
+                integrations,
+                [metadata_map[integration_name] for integration_name in integrations],
+                [last_updated_map[integration_name] for integration_name in integrations]
+            )
+            integration_data = [row for row in rows if row is not None]
+        self._store_filter(criteria_hash, criteria, [row["name"] for row in integration_data])
+        if not integration_data:
             click.echo("No integrations match the specified criteria.")
+            self.flush_cache()
             return
 
-        integration_data = []
-        for integration_name in integrations:
-            metadata = self.load_metadata(integration_name)
-            integration_data.append({
-                "name": integration_name,
-                "business_contact": metadata.get("business_contact", "N/A"),
-                "technical_contact": metadata.get("technical_contact", "N/A"),
-                "last_updated": self.get_last_updated(integration_name),
-                "description": metadata.get("description", "N/A"),
-                "version": metadata.get("version", "N/A"),
-                "valid_status": self.validate_integration(integration_name),
-                "tags": metadata.get("tags", [])
-            })
-
-        reverse = (order == "desc")
+        # Integration names are unique, so the decorated tuples never compare the rows
+        # themselves and rows with equal timestamps are ordered by name.
         if order_by == "last_updated":
-            integration_data.sort(key=lambda x: x["last_updated"] or "", reverse=reverse)
+            decorated = [(item["last_updated"] or "", item["name"], item) for item in integration_data]
         else:
-            integration_data.sort(key=lambda x: x["name"], reverse=reverse)
+            decorated = [(item["name"], "", item) for item in integration_data]
+        decorated.sort(reverse=(order == "desc"))
+        integration_data = [item for _, _, item in decorated]
 
-        click.echo(f"\nCriteria Hash: {criteria_hash}")
-        click.echo("Integrations:")
-        click.echo("-" * 140)
-        click.echo(f"{'Name':<20} {'Business Contact':<25} {'Technical Contact':<25} {'Last Updated':<20} {'Description':<20} {'Version':<10} {'Valid':<10} {'Tags':<20}")
-        click.echo("-" * 140)
+        separator = "-" * 140
+        lines = [f"\nCriteria Hash: {criteria_hash}", "Integrations:", separator, _LIST_HEADER, separator]
         for item in integration_data:
-            description = item["description"][:17] + "..." if len(item["description"]) > 17 else item["description"]
-            tags = ",".join(item["tags"])[:17] + "..." if len(",".join(item["tags"])) > 17 else ",".join(item["tags"])
-            click.echo(f"{item['name']:<20} {item['business_contact']:<25} {item['technical_contact']:<25} {item['last_updated']:<20} {description:<20} {item['version']:<10} {str(item['valid_status']):<10} {tags:<20}")
-        click.echo("-" * 140)
+            description = _truncate(item["description"])
+            tags = _truncate(",".join(item["tags"]))
+            lines.append(_LIST_ROW_FORMAT.format_map({**item, "description": description, "tags": tags}))
+        lines.append(separator)
+        click.echo("\n".join(lines))
+        self.flush_cache()
+
+    def _collect_row(
+        self,
+        integration_name: str,
+        metadata: dict,
+        last_updated: str,
+        prepared: dict
+    ) -> dict | None:
+        """Build the listing row for an integration if it matches the criteria.
+
+        Args:
+            integration_name (str): Name of the integration.
+            metadata (dict): Metadata of the integration.
+            last_updated (str): Last updated timestamp or 'N/A'.
+            prepared (dict): Criteria returned by _prepare_criteria.
+
+        Returns:
+            dict | None: Row data, or None if the integration is filtered out.
+        """
+        if not self._matches(metadata, last_updated, prepared):
+            return None
+        return {
+            "name": integration_name,
+            "business_contact": metadata.get("business_contact", "N/A"),
+            "technical_contact": metadata.get("technical_contact", "N/A"),
+            "last_updated": last_updated,
+            "description": metadata.get("description", "N/A"),
+            "version": metadata.get("version", "N/A"),
+            "valid_status": self.validate_integration(integration_name, deep=False),
+            "tags": metadata.get("tags", [])
+        }
 
     def validate(self) -> None:
-        """Validate all available integrations."""
+        """Validate all available integrations.
+
+        Integrations are validated concurrently on a thread pool; results are logged
+        in directory order and the cache is written once at the end.
+        """
         integrations = self.get_integrations()
-        for name in integrations:
-            valid = self.validate_integration(name)
-            status = "valid" if valid else "invalid"
-            logger.info(f"Integration {name} is {status}")
+        # Load the cache up front rather than on the first worker's access.
+        self.validation_cache
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.validate_integration, integrations)
+            for name, valid in zip(integrations, results):
+                status = "valid" if valid else "invalid"
+                logger.info(f"Integration {name} is {status}")
+        self.flush_cache()
 
     def report_issue(self, issue_type: str, message: str, integration_name: str | None = None) -> None:
         """Report an issue for an integration or generally.
@@ -561,9 +1396,12 @@ class BatchRunner:
         self.telemetry.generate_report(period)
 
 @click.group()
-def cli():
+@click.option('--pretty-cache', is_flag=True, help='Write the validation cache as indented JSON')
+@click.pass_context
+def cli(ctx, pretty_cache):
     """Command-line interface for managing integrations."""
-    pass
+    configure_logging()
+    ctx.obj = {"pretty_cache": pretty_cache}
 
 @cli.command(name="run")
 @click.option('--name', help='Exact integration name')
@@ -577,24 +1415,28 @@ def cli():
 @click.option('--criteria-hash', help='Run integrations matching a criteria hash')
 @click.option('--parallel', type=click.Choice(['none', 'asyncio', 'multiprocessing']), default='none')
 @click.option('--verbose', is_flag=True)
-def run_integration(name, partial_name, tag, business_contact, technical_contact,
+@click.pass_obj
+def run_integration(obj, name, partial_name, tag, business_contact, technical_contact,
                     last_updated_before, last_updated_after, description_contains,
                     criteria_hash, parallel, verbose):
     """Run integrations matching the specified criteria."""
-    runner = BatchRunner()
-    asyncio.run(runner.run_filtered(
-        name=name,
-        partial_name=partial_name,
-        tags=list(tag) if tag else None,
-        business_contact=business_contact,
-        technical_contact=technical_contact,
-        last_updated_before=last_updated_before,
-        last_updated_after=last_updated_after,
-        description_contains=description_contains,
-        criteria_hash=criteria_hash,
-        verbose=verbose,
-        parallel=parallel
-    ))
+    runner = BatchRunner(pretty_cache=obj["pretty_cache"])
+    try:
+        asyncio.run(runner.run_filtered(
+            name=name,
+            partial_name=partial_name,
+            tags=list(tag) if tag else None,
+            business_contact=business_contact,
+            technical_contact=technical_contact,
+            last_updated_before=last_updated_before,
+            last_updated_after=last_updated_after,
+            description_contains=description_contains,
+            criteria_hash=criteria_hash,
+            verbose=verbose,
+            parallel=parallel
+        ))
+    finally:
+        runner.close()
 
 @cli.command(name="list")
 @click.option('--name', help='Exact integration name')
@@ -607,29 +1449,37 @@ def run_integration(name, partial_name, tag, business_contact, technical_contact
 @click.option('--description-contains', help='Filter by description substring')
 @click.option('--order-by', type=click.Choice(['name', 'last_updated']), default='name')
 @click.option('--order', type=click.Choice(['asc', 'desc']), default='asc')
-def list_integration(name, partial_name, tag, business_contact, technical_contact,
+@click.pass_obj
+def list_integration(obj, name, partial_name, tag, business_contact, technical_contact,
                      last_updated_before, last_updated_after, description_contains,
                      order_by, order):
     """List integrations matching the specified criteria."""
-    runner = BatchRunner()
-    runner.list_integrations(
-        name=name,
-        partial_name=partial_name,
-        tags=list(tag) if tag else None,
-        business_contact=business_contact,
-        technical_contact=technical_contact,
-        last_updated_before=last_updated_before,
-        last_updated_after=last_updated_after,
-        description_contains=description_contains,
-        order_by=order_by,
-        order=order
-    )
+    runner = BatchRunner(pretty_cache=obj["pretty_cache"])
+    try:
+        runner.list_integrations(
+            name=name,
+            partial_name=partial_name,
+            tags=list(tag) if tag else None,
+            business_contact=business_contact,
+            technical_contact=technical_contact,
+            last_updated_before=last_updated_before,
+            last_updated_after=last_updated_after,
+            description_contains=description_contains,
+            order_by=order_by,
+            order=order
+        )
+    finally:
+        runner.close()
 
 @cli.command(name="validate")
-def validate():
+@click.pass_obj
+def validate(obj):
     """Validate all integrations."""
-    runner = BatchRunner()
-    runner.validate()
+    runner = BatchRunner(pretty_cache=obj["pretty_cache"])
+    try:
+        runner.validate()
+    finally:
+        runner.close()
 
 @cli.command(name="report-issue")
 @click.option('--issue-type', required=True, help='Type of issue (e.g., bug, feature)')
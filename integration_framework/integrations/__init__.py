@@ -1,7 +1,16 @@
 """Integration base class for the integration framework."""
 
 class Integration:
-    """Base class for integrations."""
+    """Base class for integrations.
+
+    Integration packages should export their subclass as a module-level
+    `INTEGRATION_CLASS` so the framework can load it without scanning the module.
+    I/O-bound integrations may implement `fetch_data` as a coroutine, or add a
+    coroutine `fetch_data_async`, to be awaited directly in asyncio batches.
+    Subclasses that declare their own `__slots__` avoid a per-instance `__dict__`.
+    """
+    __slots__ = ("config", "support", "name")
+
     def __init__(self, config, support, name):
         self.config = config
         self.support = support
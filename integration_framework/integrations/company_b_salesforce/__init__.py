@@ -3,6 +3,8 @@ from vendor.salesforce import SalesforceClient
 
 class CompanyBSalesforceIntegration(Integration):
     """Integration for Company B's Salesforce instance."""
+    __slots__ = ("client",)
+
     def __init__(self, config, support, name="company_b_salesforce"):
         """Initialize the Company B Salesforce integration."""
         super().__init__(config, support, name)
@@ -16,9 +18,18 @@ class CompanyBSalesforceIntegration(Integration):
         return self.client.query("SELECT Id, Name FROM Contact")
 
     def postprocess_data(self, data):
-        """Convert Salesforce contact data to a simplified format."""
-        return [{"id": record["Id"], "name": record["Name"]} for record in data]
+        """Convert Salesforce contact data from any iterable to a columnar format in one pass."""
+        ids = []
+        names = []
+        add_id = ids.append
+        add_name = names.append
+        for record in data:
+            add_id(record["Id"])
+            add_name(record["Name"])
+        return {"id": ids, "name": names}
 
     def deliver_results(self, data):
         """Notify about processed contacts."""
-        self.support.notify(f"Processed {len(data)} records for {self.name}")
+        self.support.notify(f"Processed {len(data['id'])} records for {self.name}")
+
+INTEGRATION_CLASS = CompanyBSalesforceIntegration
@@ -1,48 +1,39 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from integration_framework.support_manager import SupportManager
 from integration_framework.integrations.company_b_salesforce import CompanyBSalesforceIntegration
-from integration_framework.utils import check_docstrings
 
-def test_init():
+@pytest.fixture(scope="module")
+def integration(sf_config, support):
+    """Build one CompanyBSalesforceIntegration shared by the tests in this module."""
+    return CompanyBSalesforceIntegration(sf_config, support, "company_b_salesforce")
+
+def test_init(integration, support, sf_config):
     """Test CompanyBSalesforceIntegration.__init__."""
-    check_docstrings()
-    config = {"instance_url": "mock_url", "access_token": "mock_token"}
-    support = SupportManager()
-    integration = CompanyBSalesforceIntegration(config, support, "company_b_salesforce")
     assert integration.name == "company_b_salesforce"
     assert integration.support == support
-    assert integration.config == config
+    assert integration.config == sf_config
 
-def test_fetch_data():
+def test_fetch_data(integration):
     """Test CompanyBSalesforceIntegration.fetch_data."""
-    check_docstrings()
-    config = {"instance_url": "mock_url", "access_token": "mock_token"}
-    support = SupportManager()
-    integration = CompanyBSalesforceIntegration(config, support, "company_b_salesforce")
     with patch.object(integration.client, "query") as mock_query:
         mock_query.return_value = [{"Id": "001", "Name": "Test Contact"}]
         data = integration.fetch_data()
         assert data == [{"Id": "001", "Name": "Test Contact"}]
         mock_query.assert_called_with("SELECT Id, Name FROM Contact")
 
-def test_postprocess_data():
+def test_postprocess_data(integration):
     """Test CompanyBSalesforceIntegration.postprocess_data."""
-    check_docstrings()
-    config = {"instance_url": "mock_url", "access_token": "mock_token"}
-    support = SupportManager()
-    integration = CompanyBSalesforceIntegration(config, support, "company_b_salesforce")
     data = [{"Id": "001", "Name": "Test Contact"}]
     processed = integration.postprocess_data(data)
-    assert processed == [{"id": "001", "name": "Test Contact"}]
+    assert processed == {"id": ["001"], "name": ["Test Contact"]}
 
-def test_deliver_results():
+def test_deliver_results(integration, support):
     """Test CompanyBSalesforceIntegration.deliver_results."""
-    check_docstrings()
-    config = {"instance_url": "mock_url", "access_token": "mock_token"}
-    support = SupportManager()
-    integration = CompanyBSalesforceIntegration(config, support, "company_b_salesforce")
-    data = [{"id": "001", "name": "Test Contact"}]
+    data = {"id": ["001"], "name": ["Test Contact"]}
     with patch.object(support, "notify") as mock_notify:
         integration.deliver_results(data)
         mock_notify.assert_called_with("Processed 1 records for company_b_salesforce")
+
+def test_postprocess_data_iterator(integration):
+    """Test postprocess_data accepts a one-shot iterator."""
+    assert integration.postprocess_data(iter([{"Id": "001", "Name": "Test Contact"}])) == {"id": ["001"], "name": ["Test Contact"]}
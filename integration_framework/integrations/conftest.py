@@ -0,0 +1,35 @@
+import importlib
+import inspect
+import pkgutil
+import pytest
+import integration_framework.integrations as integrations_package
+from integration_framework.support_manager import SupportManager
+from integration_framework.utils import check_docstrings
+
+def check_docstrings_for(classes):
+    """Assert that each class and its public methods have docstrings."""
+    for cls in classes:
+        assert cls.__doc__, f"{cls.__name__} missing docstring"
+        for method_name, method in inspect.getmembers(cls, inspect.isfunction):
+            if not method_name.startswith("_"):
+                assert method.__doc__, f"{cls.__name__}.{method_name} missing docstring"
+
+@pytest.fixture(scope="session", autouse=True)
+def docstrings_checked():
+    """Check integration docstrings once for the whole test session."""
+    check_docstrings()
+    check_docstrings_for(
+        importlib.import_module(f"{integrations_package.__name__}.{module.name}").INTEGRATION_CLASS
+        for module in pkgutil.iter_modules(integrations_package.__path__)
+        if module.ispkg
+    )
+
+@pytest.fixture(scope="module")
+def support():
+    """Share one SupportManager across the tests of a module."""
+    return SupportManager()
+
+@pytest.fixture(scope="module")
+def sf_config():
+    """Provide the mock Salesforce configuration."""
+    return {"instance_url": "mock_url", "access_token": "mock_token"}
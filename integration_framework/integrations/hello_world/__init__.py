@@ -6,6 +6,8 @@ class HelloWorldIntegration(Integration):
 
     Returns a static message for testing purposes.
     """
+    __slots__ = ()
+
     def __init__(self, config: dict, support: SupportManager, name: str):
         """Initialize the integration with configuration and support.
 
@@ -42,3 +44,5 @@ class HelloWorldIntegration(Integration):
             data (dict): Processed message data.
         """
         self.support.notify(f"Message from {self.name}: {data['message']}")
+
+INTEGRATION_CLASS = HelloWorldIntegration
@@ -1,44 +1,36 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from integration_framework.support_manager import SupportManager
 from integration_framework.integrations.hello_world import HelloWorldIntegration
-from integration_framework.utils import check_docstrings
 
-def test_init():
+@pytest.fixture(scope="module")
+def config():
+    """Provide the hello_world configuration."""
+    return {}
+
+@pytest.fixture(scope="module")
+def integration(config, support):
+    """Build one HelloWorldIntegration shared by the tests in this module."""
+    return HelloWorldIntegration(config, support, "hello_world")
+
+def test_init(integration, support, config):
     """Test HelloWorldIntegration.__init__."""
-    check_docstrings()
-    config = {}
-    support = SupportManager()
-    integration = HelloWorldIntegration(config, support, "hello_world")
     assert integration.name == "hello_world"
     assert integration.support == support
     assert integration.config == config
 
-def test_fetch_data():
+def test_fetch_data(integration):
     """Test HelloWorldIntegration.fetch_data."""
-    check_docstrings()
-    config = {}
-    support = SupportManager()
-    integration = HelloWorldIntegration(config, support, "hello_world")
     data = integration.fetch_data()
     assert data == {"message": "Hello, World!"}
 
-def test_postprocess_data():
+def test_postprocess_data(integration):
     """Test HelloWorldIntegration.postprocess_data."""
-    check_docstrings()
-    config = {}
-    support = SupportManager()
-    integration = HelloWorldIntegration(config, support, "hello_world")
     data = {"message": "Hello, World!"}
     processed = integration.postprocess_data(data)
     assert processed == {"message": "Hello, World!"}
 
-def test_deliver_results():
+def test_deliver_results(integration, support):
     """Test HelloWorldIntegration.deliver_results."""
-    check_docstrings()
-    config = {}
-    support = SupportManager()
-    integration = HelloWorldIntegration(config, support, "hello_world")
     data = {"message": "Hello, World!"}
     with patch.object(support, "notify") as mock_notify:
         integration.deliver_results(data)
@@ -1,45 +1,174 @@
 from integration_framework.integrations import Integration
+import asyncio
+import contextlib
+import random
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 import httpx
-import backoff
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Pooled client per event loop, as [client, open scopes], shared by every WeatherNews
+# instance fetching on that loop and closed when the last fetch finishes.
+_clients = weakref.WeakKeyDictionary()
+
+def _new_client(config):
+    """Build a pooled async client from the integration config."""
+    pool = config.get("pool", 100)
+    # Pool limits and HTTP/2 belong on the transport once one is passed explicitly.
+    transport = httpx.AsyncHTTPTransport(
+        http2=_HTTP2,
+        limits=httpx.Limits(
+            max_keepalive_connections=pool,
+            max_connections=pool,
+            keepalive_expiry=30.0
+        ),
+        retries=2
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(config.get("timeout", 10), connect=5.0),
+        transport=transport
+    )
+
+@contextlib.asynccontextmanager
+async def _client_scope(config):
+    """Share the running loop's pooled client for the scope, closing it when the last scope exits."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(loop)
+    if entry is None:
+        entry = _clients[loop] = [_new_client(config), 0]
+    entry[1] += 1
+    try:
+        yield entry[0]
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _clients[loop]
+            await entry[0].aclose()
+
+# Decoded responses keyed by (request URL, API key), stored as (monotonic time, payload)
+# in the order they were stored, so the oldest entries are always at the front.
+_CACHE: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+_CACHE_SIZE = 256
+# enabled:   serve fresh cached responses and store new ones.
+# read_only: serve fresh cached responses but never store new ones.
+# disabled:  always call the API and leave the cache untouched.
+# replay:    serve cached responses regardless of age and never call the API.
+_CACHE_POLICIES = ("enabled", "read_only", "disabled", "replay")
+
+def _cache_store(key, payload, ttl):
+    """Store a response, first dropping expired entries and then the oldest beyond _CACHE_SIZE."""
+    now = time.monotonic()
+    _CACHE.pop(key, None)
+    while _CACHE and now - next(iter(_CACHE.values()))[0] >= ttl:
+        _CACHE.popitem(last=False)
+    _CACHE[key] = (now, payload)
+    while len(_CACHE) > _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+
+@dataclass(slots=True, frozen=True)
+class WeatherRecord:
+    """Current weather for one city."""
+    city: str | None
+    temperature: float | None
 
 class WeatherNewsIntegration(Integration):
     """Integration for fetching weather news data."""
+    __slots__ = ("_client", "api_key", "api_url", "cache_ttl", "cache_policy")
+
     def __init__(self, config, support, name="weather_news"):
         """Initialize the weather news integration."""
         super().__init__(config, support, name)
-        self.client = httpx.AsyncClient(
-            timeout=config.get("timeout", 10)
-        )
+        self._client = None
         self.api_key = config.get("api_key")
         self.api_url = config.get("api_url", "https://api.weatherapi.com/v1")
+        self.cache_ttl = config.get("cache_ttl", 60)
+        self.cache_policy = config.get("cache_policy", "enabled")
+        if self.cache_policy not in _CACHE_POLICIES:
+            raise ValueError(f"Unknown cache_policy {self.cache_policy!r}; expected one of {_CACHE_POLICIES}")
 
-    @backoff.on_predicate(
-        backoff.expo,
-        predicate=lambda result: result.status_code == 429,
-        max_tries=3,
-        max_time=10.0,
-        factor=1.5,
-        jitter=backoff.full_jitter
-    )
-    async def _request(self):
-        """Make an HTTP request with backoff for 429 responses."""
-        return await self.client.get(
-            f"{self.api_url}/current.json",
-            params={"key": self.api_key, "q": "auto:ip"}
-        )
+    @property
+    def client(self):
+        """Return the dedicated client, or the pooled client of the fetch running on this loop."""
+        if self._client is not None:
+            return self._client
+        entry = _clients.get(asyncio.get_running_loop())
+        if entry is None:
+            raise RuntimeError("The shared weather client only exists while a fetch is running")
+        return entry[0]
+
+    def _session(self):
+        """Return the context that provides the client for one fetch."""
+        if self._client is not None:
+            return contextlib.nullcontext(self._client)
+        return _client_scope(self.config)
+
+    @client.setter
+    def client(self, client):
+        """Use a dedicated HTTP client instead of the shared pool."""
+        self._client = client
+
+    async def _request(self, query="auto:ip", max_tries=3):
+        """Make an HTTP request, retrying 429 responses after the server's Retry-After delay."""
+        for attempt in range(max_tries):
+            response = await self.client.get(
+                f"{self.api_url}/current.json",
+                params={"key": self.api_key, "q": query}
+            )
+            if response.status_code != 429 or attempt == max_tries - 1:
+                return response
+            try:
+                delay = float(response.headers.get("Retry-After", 1.5 ** attempt))
+            except ValueError:
+                # HTTP-date form of Retry-After; use the default schedule.
+                delay = 1.5 ** attempt
+            await asyncio.sleep(min(delay + random.random() * 0.5, 10.0))
+        return response
 
     async def fetch_data(self):
-        """Fetch current weather data from the weather API."""
-        response = await self._request()
-        return response.json() if response.status_code == 200 else {}
+        """Fetch current weather data for the caller's location."""
+        async with self._session():
+            return await self._fetch("auto:ip")
+
+    async def fetch_many(self, queries):
+        """Fetch current weather for several locations concurrently, in the order given."""
+        async with self._session():
+            return list(await asyncio.gather(*(self._fetch(query) for query in queries)))
+
+    async def _fetch(self, query):
+        """Fetch one location, serving repeat polls within cache_ttl from memory."""
+        key = (f"{self.api_url}/current.json?q={query}", self.api_key)
+        if self.cache_policy != "disabled":
+            cached = _CACHE.get(key)
+            if cached is not None and (self.cache_policy == "replay" or time.monotonic() - cached[0] < self.cache_ttl):
+                return cached[1]
+            if self.cache_policy == "replay":
+                return {}
+        response = await self._request(query)
+        if response.status_code != 200:
+            return {}
+        payload = orjson.loads(response.content) if orjson is not None else response.json()
+        if self.cache_policy == "enabled":
+            _cache_store(key, payload, self.cache_ttl)
+        return payload
 
     def postprocess_data(self, data):
         """Extract relevant weather information."""
-        return {
-            "city": data.get("name"),
-            "temperature": data.get("main", {}).get("temp")
-        }
+        return WeatherRecord(city=data.get("name"), temperature=data.get("main", {}).get("temp"))
 
     def deliver_results(self, data):
         """Notify about weather updates."""
-        self.support.notify(f"Weather for {data.get('city')}: {data.get('temperature')}°C")
+        self.support.notify(f"Weather for {data.city}: {data.temperature}°C")
+
+INTEGRATION_CLASS = WeatherNewsIntegration
@@ -1,53 +1,136 @@
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
-from integration_framework.support_manager import SupportManager
-from integration_framework.integrations.weather_news import WeatherNewsIntegration
-from integration_framework.utils import check_docstrings
+import integration_framework.integrations.weather_news as weather_module
+from integration_framework.integrations.weather_news import WeatherNewsIntegration, WeatherRecord, _CACHE
 
-@pytest.mark.asyncio
-async def test_init():
+@pytest.fixture(scope="module")
+def config():
+    """Provide the weather_news configuration."""
+    return {"api_url": "http://api.example.com/weather"}
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty response cache."""
+    _CACHE.clear()
+    yield
+    _CACHE.clear()
+
+@pytest.fixture
+def http_client(monkeypatch):
+    """Stand in for the pooled HTTP client the integration opens per fetch."""
+    client = MagicMock(get=AsyncMock(), aclose=AsyncMock())
+    monkeypatch.setattr(weather_module, "_new_client", lambda config: client)
+    return client
+
+@pytest.fixture(scope="module")
+def integration(config, support):
+    """Build one WeatherNewsIntegration shared by the tests in this module."""
+    return WeatherNewsIntegration(config, support, "weather_news")
+
+def test_init(integration, support):
     """Test WeatherNewsIntegration.__init__."""
-    check_docstrings()
-    config = {"api_url": "http://api.example.com/weather"}
-    support = SupportManager()
-    integration = WeatherNewsIntegration(config, support, "weather_news")
     assert integration.name == "weather_news"
     assert integration.support == support
     assert integration.api_url == "http://api.example.com/weather"
 
 @pytest.mark.asyncio
-async def test_fetch_data():
+async def test_fetch_data(integration, http_client):
     """Test WeatherNewsIntegration.fetch_data."""
-    check_docstrings()
-    config = {"api_url": "http://api.example.com/weather"}
-    support = SupportManager()
-    integration = WeatherNewsIntegration(config, support, "weather_news")
-    with patch.object(integration.client, "get", new=AsyncMock()) as mock_get:
-        mock_response = MagicMock(status_code=200)
-        mock_response.json.return_value = {"main": {"temp": 20}, "name": "London"}
-        mock_get.return_value = mock_response
-        data = await integration.fetch_data()
-        assert data == {"main": {"temp": 20}, "name": "London"}
+    mock_response = MagicMock(status_code=200, content=b'{"main": {"temp": 20}, "name": "London"}')
+    mock_response.json.return_value = {"main": {"temp": 20}, "name": "London"}
+    http_client.get.return_value = mock_response
+    data = await integration.fetch_data()
+    assert data == {"main": {"temp": 20}, "name": "London"}
+    http_client.aclose.assert_awaited_once()
 
-@pytest.mark.asyncio
-async def test_postprocess_data():
+def test_postprocess_data(integration):
     """Test WeatherNewsIntegration.postprocess_data."""
-    check_docstrings()
-    config = {"api_url": "http://api.example.com/weather"}
-    support = SupportManager()
-    integration = WeatherNewsIntegration(config, support, "weather_news")
     data = {"main": {"temp": 20}, "name": "London"}
     processed = integration.postprocess_data(data)
-    assert processed == {"city": "London", "temperature": 20}
+    assert processed == WeatherRecord(city="London", temperature=20)
 
-@pytest.mark.asyncio
-async def test_deliver_results():
+def test_deliver_results(integration, support):
     """Test WeatherNewsIntegration.deliver_results."""
-    check_docstrings()
-    config = {"api_url": "http://api.example.com/weather"}
-    support = SupportManager()
-    integration = WeatherNewsIntegration(config, support, "weather_news")
-    data = {"temperature": 20, "city": "London"}
+    data = WeatherRecord(city="London", temperature=20)
     with patch.object(support, "notify") as mock_notify:
         integration.deliver_results(data)
         mock_notify.assert_called_with("Weather for London: 20°C")
+
+@pytest.mark.asyncio
+async def test_shared_client(support, config):
+    """Test concurrent fetches on one loop share a pooled client that closes after the last one."""
+    first = WeatherNewsIntegration(config, support, "weather_news")
+    second = WeatherNewsIntegration(config, support, "weather_news")
+    with pytest.raises(RuntimeError):
+        first.client
+    async with first._session() as client:
+        async with second._session():
+            assert first.client is second.client is client
+        assert not client.is_closed
+    assert client.is_closed
+    with pytest.raises(RuntimeError):
+        second.client
+
+def test_no_client_outside_event_loop(integration):
+    """Test the shared client is never built outside a running event loop."""
+    with pytest.raises(RuntimeError):
+        integration.client
+
+@pytest.mark.asyncio
+async def test_request_retry_after(support, config):
+    """Test WeatherNewsIntegration._request honours Retry-After on 429 responses."""
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "2"})
+    ok = MagicMock(status_code=200, headers={})
+    integration = WeatherNewsIntegration(config, support, "weather_news")
+    integration.client = MagicMock(get=AsyncMock(side_effect=[throttled, ok]))
+    with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep, \
+         patch("random.random", return_value=0.0):
+        response = await integration._request()
+    assert response is ok
+    assert integration.client.get.call_count == 2
+    mock_sleep.assert_awaited_once_with(2.0)
+
+@pytest.mark.asyncio
+async def test_fetch_data_cached(integration, config, support, http_client):
+    """Test WeatherNewsIntegration.fetch_data serves repeat polls from the response cache."""
+    mock_response = MagicMock(status_code=200, content=b'{"name": "London"}')
+    mock_response.json.return_value = {"name": "London"}
+    http_client.get.return_value = mock_response
+    assert await integration.fetch_data() == {"name": "London"}
+    assert await integration.fetch_data() == {"name": "London"}
+    assert http_client.get.call_count == 1
+    http_client.get.reset_mock()
+    uncached = WeatherNewsIntegration({**config, "cache_policy": "disabled"}, support, "weather_news")
+    await uncached.fetch_data()
+    await uncached.fetch_data()
+    assert http_client.get.call_count == 2
+
+def test_invalid_cache_policy(config, support):
+    """Test WeatherNewsIntegration rejects unknown cache policies."""
+    with pytest.raises(ValueError):
+        WeatherNewsIntegration({**config, "cache_policy": "sometimes"}, support, "weather_news")
+
+@pytest.mark.asyncio
+async def test_fetch_many(integration, http_client):
+    """Test WeatherNewsIntegration.fetch_many returns one payload per location in order."""
+    def respond(url, params):
+        response = MagicMock(status_code=200, content=f'{{"name": "{params["q"]}"}}'.encode())
+        response.json.return_value = {"name": params["q"]}
+        return response
+    http_client.get.side_effect = respond
+    data = await integration.fetch_many(["London", "Paris"])
+    assert data == [{"name": "London"}, {"name": "Paris"}]
+    assert http_client.get.call_count == 2
+    http_client.aclose.assert_awaited_once()
+
+def test_cache_store_bounded(monkeypatch):
+    """Test the response cache drops expired entries on insert and keeps at most _CACHE_SIZE."""
+    monkeypatch.setattr(weather_module, "_CACHE_SIZE", 2)
+    with patch("time.monotonic", return_value=100.0):
+        weather_module._cache_store(("a", None), {"name": "a"}, 60)
+    with patch("time.monotonic", return_value=170.0):
+        weather_module._cache_store(("b", None), {"name": "b"}, 60)
+        assert list(_CACHE) == [("b", None)]
+        weather_module._cache_store(("c", None), {"name": "c"}, 60)
+        weather_module._cache_store(("d", None), {"name": "d"}, 60)
+    assert list(_CACHE) == [("c", None), ("d", None)]
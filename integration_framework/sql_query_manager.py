@@ -1,10 +1,111 @@
+import asyncio
+import atexit
+import functools
+import os
 import sqlite3
-from collections import namedtuple
-from typing import Iterator, Optional, List
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, List, Sequence
 import re
 
+_COL_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+@functools.lru_cache(maxsize=128)
+def _record_type(columns: tuple[str, ...]) -> type:
+    """Return the namedtuple class for a result set's raw column names."""
+    return namedtuple('Row', [_COL_RE.sub('_', col) for col in columns])
+
+# Rows fetched per fetchmany() call when streaming query results.
+_FETCH_SIZE = 1024
+
+# Seconds a SELECT result may be served from the per-connection result cache;
+# 0 (the default) disables the cache.
+_RESULT_CACHE_TTL = float(os.environ.get("IF_RESULT_CACHE_TTL") or 0)
+_RESULT_CACHE_SIZE = 128
+_SELECT_RE = re.compile(r'\s*(SELECT|WITH)\b', re.IGNORECASE)
+
+# Pooled connections, one per (thread, db_path), each usable only by the thread that
+# opened it. _POOL_ALL tracks every pooled connection so shutdown() can close those
+# of the calling thread; bumping _POOL_GENERATION makes every other thread close its
+# own stale handles on next use.
+_POOL = threading.local()
+_POOL_ALL: list[sqlite3.Connection] = []
+_POOL_LOCK = threading.Lock()
+_POOL_GENERATION = 0
+
+def _reset_pool_after_fork() -> None:
+    """Drop connections inherited from the parent; SQLite handles must not cross fork()."""
+    global _POOL, _POOL_LOCK
+    _POOL = threading.local()
+    _POOL_LOCK = threading.Lock()
+    _POOL_ALL.clear()
+
+class QueryResultCache:
+    """LRU cache of materialized SELECT results for one pooled connection.
+
+    Entries expire after ttl seconds, and the whole cache is dropped as soon as the
+    database version changes (see SQLQueryManager._database_version).
+    """
+    __slots__ = ("ttl", "maxsize", "_entries", "_version")
+
+    def __init__(self, ttl: float, maxsize: int = _RESULT_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._version = None
+
+    def get(self, key: tuple, version: tuple) -> Optional[tuple]:
+        """Return the cached (columns, rows) for key, or None if missing or stale."""
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[2]:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[0], entry[1]
+
+    def put(self, key: tuple, columns: tuple, rows: tuple) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        self._entries[key] = (columns, rows, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+def configure_connection(connection: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply the pragmas shared by all telemetry database connections.
+    
+    WAL journaling lets readers proceed while a run is being logged, and
+    synchronous=NORMAL only syncs at checkpoints instead of on every commit.
+    The page cache is set to about 8 MB and the WAL is checkpointed every 1000 pages.
+    
+    Args:
+        connection (sqlite3.Connection): Freshly opened connection.
+    
+    Returns:
+        sqlite3.Connection: The same connection, for chaining.
+    """
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA busy_timeout=5000")
+    connection.execute("PRAGMA temp_store=MEMORY")
+    connection.execute("PRAGMA cache_size=-8000")
+    connection.execute("PRAGMA wal_autocheckpoint=1000")
+    return connection
+
 class SQLQueryManager:
     """Manage SQLite database connections and execute queries safely."""
+    __slots__ = ("db_path", "connection", "cursor")
+
     
     def __init__(self, db_path: str):
         """Initialize the SQLQueryManager with a database path.
@@ -17,34 +118,67 @@ class SQLQueryManager:
         self.cursor = None
     
     def __enter__(self):
-        """Enter the context manager, opening a database connection."""
-        self.connection = sqlite3.connect(self.db_path)
+        """Enter the context manager, borrowing the thread's pooled connection.
+
+        The schema is owned by TelemetryManager, which creates it once on startup.
+        """
+        self.connection = self._pooled_connection(self.db_path)
         self.cursor = self.connection.cursor()
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS telemetry (
-                id INTEGER PRIMARY KEY,
-                timestamp TEXT,
-                integration_name TEXT
-            )
-        """)
-        self.cursor.execute("INSERT OR IGNORE INTO telemetry VALUES (?, ?, ?)", 
-                           (1, "2025-04-22T10:00:00", "test"))
-        self.connection.commit()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit the context manager, closing the cursor and connection."""
+        """Exit the context manager, closing the cursor and returning the connection to the pool."""
         if self.cursor:
             self.cursor.close()
             self.cursor = None
         if self.connection:
-            self.connection.commit()
-            self.connection.close()
+            if self.connection.in_transaction:
+                self.connection.commit()
             self.connection = None
+
+    @staticmethod
+    def _pooled_connection(db_path: str) -> sqlite3.Connection:
+        """Return the calling thread's connection to db_path, opening it on first use."""
+        connections = getattr(_POOL, "connections", None)
+        if connections is None or _POOL.generation != _POOL_GENERATION:
+            for stale in (connections or {}).values():
+                stale.close()
+            connections = _POOL.connections = {}
+            _POOL.result_caches = {}
+            _POOL.generation = _POOL_GENERATION
+        connection = connections.get(db_path)
+        if connection is None:
+            connection = configure_connection(sqlite3.connect(db_path, cached_statements=256))
+            connections[db_path] = connection
+            with _POOL_LOCK:
+                _POOL_ALL.append(connection)
+        return connection
+
+    @staticmethod
+    def shutdown() -> None:
+        """Retire every pooled connection; called automatically at interpreter exit.
+
+        The calling thread's connections are closed now. Other threads close theirs on
+        their next use of the pool, and those of finished threads are closed when
+        garbage collected.
+        """
+        global _POOL_GENERATION
+        with _POOL_LOCK:
+            connections = list(_POOL_ALL)
+            _POOL_ALL.clear()
+            _POOL_GENERATION += 1
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.ProgrammingError:
+                pass
     
     def execute_query(self, query: str, params: Optional[List] = None) -> Iterator[dict]:
         """Execute a SELECT query and yield results as dictionaries.
         
+        When IF_RESULT_CACHE_TTL is set, repeated SELECTs are answered from a
+        per-connection result cache until the TTL expires or the database changes.
+        
         Args:
             query (str): The SQL SELECT query to execute.
             params (list, optional): Parameters for the query to prevent SQL injection.
@@ -56,18 +190,29 @@ class SQLQueryManager:
             ValueError: If called outside a context manager.
             sqlite3.Error: If the query execution fails.
         """
-        if self.cursor is None:
-            raise ValueError("SQLQueryManager must be used within a context manager")
-        try:
-            if params:
-                self.cursor.execute(query, params)
-            else:
-                self.cursor.execute(query)
-            columns = [description[0] for description in self.cursor.description]
-            for row in self.cursor.fetchall():
-                yield dict(zip(columns, row))
-        except sqlite3.Error as e:
-            raise sqlite3.Error(f"Query execution failed: {e}")
+        self._check_active()
+        return self._iter_rows(query, params)
+    
+    def aexecute_query(self, query: str, params: Optional[List] = None) -> AsyncIterator[dict]:
+        """Execute a SELECT query and asynchronously yield results as dictionaries.
+        
+        The query runs on a dedicated connection owned by a single worker thread, so
+        the event loop can overlap SQLite I/O with other work such as HTTP requests.
+        That connection only sees committed data, not this manager's open transaction.
+        
+        Args:
+            query (str): The SQL SELECT query to execute.
+            params (list, optional): Parameters for the query to prevent SQL injection.
+        
+        Yields:
+            AsyncIterator[dict]: Each row as a dictionary with column names as keys.
+        
+        Raises:
+            ValueError: If called outside a context manager.
+            sqlite3.Error: If the query execution fails.
+        """
+        self._check_active()
+        return self._aiter_rows(query, params)
     
     def execute_query_as_namedtuple(self, query: str, params: Optional[List] = None) -> Iterator[tuple]:
         """Execute a SELECT query and yield results as namedtuples.
@@ -83,17 +228,216 @@ class SQLQueryManager:
             ValueError: If called outside a context manager.
             sqlite3.Error: If the query execution fails.
         """
+        self._check_active()
+        return self._iter_records(query, params)
+    
+    def execute_query_as_rows(self, query: str, params: Optional[List] = None) -> Iterator[sqlite3.Row]:
+        """Execute a SELECT query and yield results as sqlite3.Row objects.
+        
+        Rows support both index and column-name access without building a dict per
+        row. They are read from a dedicated cursor and bypass the result cache.
+        
+        Args:
+            query (str): The SQL SELECT query to execute.
+            params (list, optional): Parameters for the query to prevent SQL injection.
+        
+        Yields:
+            Iterator[sqlite3.Row]: Each row as a sqlite3.Row.
+        
+        Raises:
+            ValueError: If called outside a context manager.
+            sqlite3.Error: If the query execution fails.
+        """
+        self._check_active()
+        return self._iter_sqlite_rows(query, params)
+    
+    def execute_query_columnar(self, query: str, params: Optional[List] = None) -> dict[str, list]:
+        """Execute a SELECT query and return its results column by column.
+        
+        The whole result set is fetched at once and transposed, so scans over a single
+        column touch one list instead of every row dict.
+        
+        Args:
+            query (str): The SQL SELECT query to execute.
+            params (list, optional): Parameters for the query to prevent SQL injection.
+        
+        Returns:
+            dict[str, list]: Column name to the list of that column's values, in row order.
+        
+        Raises:
+            ValueError: If called outside a context manager.
+            sqlite3.Error: If the query execution fails.
+        """
+        self._check_active()
+        cached = self._cached_result(query, params)
+        if cached is not None:
+            columns, rows = cached
+        else:
+            cursor = self._execute(query, params)
+            columns = tuple(description[0] for description in cursor.description)
+            rows = cursor.fetchall()
+        if not rows:
+            return {column: [] for column in columns}
+        return dict(zip(columns, map(list, zip(*rows))))
+    
+    def fetch_scalar(self, query: str, params: Optional[List] = None) -> Any:
+        """Execute a SELECT query and return the first column of its first row.
+        
+        Args:
+            query (str): The SQL SELECT query to execute.
+            params (list, optional): Parameters for the query to prevent SQL injection.
+        
+        Returns:
+            Any: The first column of the first row, or None if the query returns no rows.
+        
+        Raises:
+            ValueError: If called outside a context manager.
+            sqlite3.Error: If the query execution fails.
+        """
+        self._check_active()
+        row = self._execute(query, params).fetchone()
+        return row[0] if row else None
+
+    def execute_many(self, query: str, params_iter: Iterable[Sequence]) -> int:
+        """Execute one statement for every parameter set in a single executemany call.
+        
+        Args:
+            query (str): The SQL statement to execute.
+            params_iter (Iterable[Sequence]): Parameter sets, one per execution.
+        
+        Returns:
+            int: The total number of rows modified.
+        
+        Raises:
+            ValueError: If called outside a context manager.
+            sqlite3.Error: If the statement execution fails.
+        """
+        self._check_active()
+        return self.cursor.executemany(query, params_iter).rowcount
+
+    def _open_worker_cursor(self, query: str, params: Optional[List]) -> sqlite3.Cursor:
+        """Open a private connection to db_path and run a query on it, in the calling worker thread."""
+        connection = configure_connection(sqlite3.connect(self.db_path))
+        try:
+            if params:
+                return connection.execute(query, params)
+            return connection.execute(query)
+        except BaseException:
+            connection.close()
+            raise
+
+    def _check_active(self) -> None:
+        """Raise ValueError unless the context manager has been entered."""
         if self.cursor is None:
             raise ValueError("SQLQueryManager must be used within a context manager")
+
+    def _execute(self, query: str, params: Optional[List]) -> sqlite3.Cursor:
+        """Run a query on the live cursor; sqlite3 errors propagate unchanged."""
+        if params:
+            return self.cursor.execute(query, params)
+        return self.cursor.execute(query)
+
+    def _open_cursor(self, query: str, params: Optional[List]) -> sqlite3.Cursor:
+        """Run a query on a new cursor of the connection, so streaming it survives other queries."""
+        cursor = self.connection.cursor()
         try:
             if params:
-                self.cursor.execute(query, params)
-            else:
-                self.cursor.execute(query)
-            columns = [description[0] for description in self.cursor.description]
-            sanitized_columns = [re.sub(r'[^a-zA-Z0-9_]', '_', col) for col in columns]
-            Row = namedtuple('Row', sanitized_columns)
-            for row in self.cursor.fetchall():
-                yield Row(*row)
-        except sqlite3.Error as e:
-            raise sqlite3.Error(f"Query execution failed: {e}")
+                return cursor.execute(query, params)
+            return cursor.execute(query)
+        except BaseException:
+            cursor.close()
+            raise
+
+    def _database_version(self) -> tuple[int, int]:
+        """Return a token that changes whenever the database may have changed.
+
+        PRAGMA data_version moves when another connection commits, and total_changes
+        counts this connection's own writes, committed or not.
+        """
+        return self.connection.execute("PRAGMA data_version").fetchone()[0], self.connection.total_changes
+
+    def _cached_result(self, query: str, params: Optional[List]) -> Optional[tuple]:
+        """Return (columns, rows) for a SELECT through the result cache, or None when it does not apply."""
+        if _RESULT_CACHE_TTL <= 0 or not _SELECT_RE.match(query):
+            return None
+        caches = _POOL.result_caches
+        cache = caches.get(self.db_path)
+        if cache is None:
+            cache = caches[self.db_path] = QueryResultCache(_RESULT_CACHE_TTL)
+        key = (query, tuple(sorted(params.items())) if isinstance(params, dict) else tuple(params or ()))
+        result = cache.get(key, self._database_version())
+        if result is None:
+            cursor = self._execute(query, params)
+            result = (tuple(description[0] for description in cursor.description), tuple(cursor.fetchall()))
+            cache.put(key, *result)
+        return result
+
+    def _iter_rows(self, query: str, params: Optional[List]) -> Iterator[dict]:
+        """Yield rows as dictionaries from a cursor of their own, assuming the context is active."""
+        cached = self._cached_result(query, params)
+        if cached is not None:
+            columns, rows = cached
+            for row in rows:
+                yield dict(zip(columns, row))
+            return
+        cursor = self._open_cursor(query, params)
+        try:
+            columns = tuple(description[0] for description in cursor.description)
+            while True:
+                batch = cursor.fetchmany(_FETCH_SIZE)
+                if not batch:
+                    break
+                for row in batch:
+                    yield dict(zip(columns, row))
+        finally:
+            cursor.close()
+
+    async def _aiter_rows(self, query: str, params: Optional[List]) -> AsyncIterator[dict]:
+        """Yield rows as dictionaries from a worker-owned connection, assuming the context is active."""
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=1) as worker:
+            cursor = await loop.run_in_executor(worker, self._open_worker_cursor, query, params)
+            try:
+                columns = tuple(description[0] for description in cursor.description)
+                while True:
+                    batch = await loop.run_in_executor(worker, cursor.fetchmany, _FETCH_SIZE)
+                    if not batch:
+                        break
+                    for row in batch:
+                        yield dict(zip(columns, row))
+            finally:
+                await loop.run_in_executor(worker, cursor.connection.close)
+
+    def _iter_sqlite_rows(self, query: str, params: Optional[List]) -> Iterator[sqlite3.Row]:
+        """Yield sqlite3.Row objects from a cursor of their own, assuming the context is active."""
+        cursor = self._open_cursor(query, params)
+        cursor.row_factory = sqlite3.Row
+        try:
+            while True:
+                batch = cursor.fetchmany(_FETCH_SIZE)
+                if not batch:
+                    break
+                yield from batch
+        finally:
+            cursor.close()
+
+    def _iter_records(self, query: str, params: Optional[List]) -> Iterator[tuple]:
+        """Yield rows as namedtuples from a cursor of their own, assuming the context is active."""
+        cached = self._cached_result(query, params)
+        if cached is not None:
+            columns, rows = cached
+            yield from map(_record_type(columns)._make, rows)
+            return
+        cursor = self._open_cursor(query, params)
+        try:
+            make = _record_type(tuple(description[0] for description in cursor.description))._make
+            while True:
+                batch = cursor.fetchmany(_FETCH_SIZE)
+                if not batch:
+                    break
+                for row in batch:
+                    yield make(row)
+        finally:
+            cursor.close()
+
+atexit.register(SQLQueryManager.shutdown)
@@ -1,31 +1,38 @@
 import logging
-import backoff
+import random
 import time
 
 logger = logging.getLogger(__name__)
 logger.propagate = True
 
+# Bound logger methods by level name, resolved once instead of on every log call.
+_LOG_DISPATCH = {
+    name: getattr(logger, name)
+    for name in ("debug", "info", "warning", "error", "critical")
+}
+
+def _log_func(level: str):
+    """Return the logger method for a level name, defaulting to info."""
+    return _LOG_DISPATCH.get(level) or _LOG_DISPATCH.get(level.lower(), logger.info)
+
 class SupportManager:
     def __init__(self):
-        self.backoff_state = {}
+        # Monotonic deadline per key; the key is suppressed until the deadline passes.
+        self.backoff_state: dict[str, float] = {}
         self.initial_delay = 1.0
         self.multiplier = 2.0
         self.max_delay = 60.0
 
     def _should_log(self, key: str, current_time: float) -> bool:
         """Return True if enough time has passed since the last log."""
-        last_time, retry_count = self.backoff_state.get(key, (0.0, 0))
-        delay = min(self.initial_delay * (self.multiplier ** retry_count), self.max_delay)
-        logger.debug(f"Key: {key}, Current time: {current_time}, Last time: {last_time}, Retry count: {retry_count}, Delay: {delay}")
-        if current_time < last_time + delay:
-            self.backoff_state[key] = (last_time, 0)
-            return False
-        return True
+        deadline = self.backoff_state.get(key, 0.0)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Key: %s, Current time: %s, Deadline: %s", key, current_time, deadline)
+        return current_time >= deadline
 
     def log(self, message: str, level: str = "info") -> bool:
         """Log a message without backoff."""
-        log_func = getattr(logger, level.lower(), logger.info)
-        log_func(message)
+        _log_func(level)(message)
         return True
 
     def notify(self, message: str, integration_name: str = None) -> bool:
@@ -49,22 +56,23 @@ class SupportManager:
         result, _ = self.log_with_backoff(key, f"Issue in {integration_name}: {issue_type.capitalize()}: {message}", level="error")
         return result
     
-    @backoff.on_predicate(
-        backoff.expo,
-        predicate=lambda result: not result[0],
-        max_tries=3,
-        max_time=60.0,
-        factor=1.0,
-        logger=None,
-        on_success=lambda details: details["args"][0].backoff_state.update({details["args"][1]: (details["value"][1], 0)}),
-        on_backoff=lambda details: logger.debug(f"Backoff retry: {details}")
-    )
-    def log_with_backoff(self, key: str, message: str, level: str = "info") -> tuple[bool, float]:
+    def log_with_backoff(self, key: str, message: str, level: str = "info", max_tries: int = 3) -> tuple[bool, float]:
         """Log a message with exponential backoff to reduce frequency over time."""
-        current_time = time.time()
-        logger.debug(f"Attempting log: Key: {key}, Message: {message}, Level: {level}")
-        if self._should_log(key, current_time):
-            log_func = getattr(logger, level.lower(), logger.info)
-            log_func(message)
-            return (True, current_time)
-        return (False, current_time)
\ No newline at end of file
+        for attempt in range(max_tries):
+            logged, now = self._try_log(key, message, level)
+            if logged or attempt == max_tries - 1:
+                return (logged, now)
+            # Full-jitter exponential wait between attempts, capped at max_delay.
+            wait = random.random() * min(2 ** attempt, self.max_delay)
+            logger.debug("Backoff retry %s for %s after %.2fs", attempt + 1, key, wait)
+            time.sleep(wait)
+        return (False, time.monotonic())
+
+    def _try_log(self, key: str, message: str, level: str) -> tuple[bool, float]:
+        """Log the message if the key is outside its backoff window."""
+        now = time.monotonic()
+        if not self._should_log(key, now):
+            return (False, now)
+        _log_func(level)(message)
+        self.backoff_state[key] = now + min(self.initial_delay, self.max_delay)
+        return (True, now)
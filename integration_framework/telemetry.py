@@ -1,21 +1,66 @@
+import atexit
+import queue
 import sqlite3
+import threading
+import time
+import weakref
 from datetime import datetime
 from pathlib import Path
 import csv
 import logging
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+from integration_framework.sql_query_manager import configure_connection
+
 logger = logging.getLogger(__name__)
 
+# The background writer commits up to _BATCH_SIZE queued runs per transaction and
+# waits at most _BATCH_WAIT seconds for a batch to fill.
+_BATCH_SIZE = 100
+_BATCH_WAIT = 0.05
+_STOP = object()
+
+_INSERT_RUN = (
+    "INSERT INTO telemetry (integration_name, status, duration, timestamp, error) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+def _close_connections(connections: list[sqlite3.Connection]) -> None:
+    """Close every connection a TelemetryManager opened."""
+    while connections:
+        connections.pop().close()
+
 class TelemetryManager:
     """Manages telemetry data logging to a SQLite database."""
     def __init__(self, db_path: str) -> None:
         self.db_path = Path(db_path)
+        self._queue: queue.Queue = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        weakref.finalize(self, _close_connections, self._connections)
         self._initialize_db()
 
+    def _conn(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = configure_connection(sqlite3.connect(self.db_path, check_same_thread=False))
+            self._local.conn = conn
+            self._connections.append(conn)
+        return conn
+
+    def _close_thread_connection(self) -> None:
+        """Close the calling thread's connection, if it has one."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            self._connections.remove(conn)
+            conn.close()
+
     def _initialize_db(self) -> None:
         """Initialize the telemetry database and table."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS telemetry (
@@ -27,21 +72,84 @@ class TelemetryManager:
                     error TEXT
                 )
             """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_telemetry_ts ON telemetry(timestamp, integration_name)")
             conn.commit()
 
     def log_run(self, integration_name: str, status: str, duration: float, error: str | None = None) -> None:
-        """Log an integration run to the database."""
-        timestamp = datetime.now().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO telemetry (integration_name, status, duration, timestamp, error) VALUES (?, ?, ?, ?, ?)",
-                (integration_name, status, duration, timestamp, error)
-            )
-            conn.commit()
+        """Queue an integration run to be logged by the background writer."""
+        self._ensure_writer()
+        self._queue.put((integration_name, status, duration, datetime.now().isoformat(), error))
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread on first use."""
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="telemetry-writer", daemon=True)
+                self._writer.start()
+                atexit.register(self.close)
+
+    def _write_loop(self) -> None:
+        """Drain queued runs into grouped transactions until stopped."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._close_thread_connection()
+                self._queue.task_done()
+                return
+            rows = [item]
+            stop = False
+            deadline = time.monotonic() + _BATCH_WAIT
+            while len(rows) < _BATCH_SIZE:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                rows.append(item)
+            try:
+                self.log_run_many(rows)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write {len(rows)} telemetry rows: {e}")
+            finally:
+                if stop:
+                    self._close_thread_connection()
+                for _ in range(len(rows) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Block until every queued run has been written."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write any queued runs and stop the background writer."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        self._queue.put(_STOP)
+        writer.join()
+        atexit.unregister(self.close)
+
+    def log_run_many(self, rows: list[tuple[str, str, float, str, str | None]]) -> None:
+        """Log several integration runs in one transaction.
+
+        Each row is (integration_name, status, duration, timestamp, error).
+        """
+        if not rows:
+            return
+        with self._conn() as conn:
+            conn.executemany(_INSERT_RUN, rows)
 
     def generate_report(self, period: str) -> None:
         """Generate a telemetry report for a given period (YYYY-MM)."""
+        self.flush()
         try:
             start_date = datetime.strptime(period, "%Y-%m")
             end_date = (start_date.replace(day=1, month=start_date.month % 12 + 1) if start_date.month < 12
@@ -61,25 +169,16 @@ class TelemetryManager:
             WHERE timestamp >= ? AND timestamp < ?
             GROUP BY integration_name
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, (start_date.isoformat(), end_date.isoformat()))
-            results = cursor.fetchall()
-
         output_dir = Path("output")
         output_dir.mkdir(exist_ok=True)
         output_file = output_dir / f"telemetry_report_{period}.csv"
         
-        with output_file.open("w", newline="") as f:
+        # The cursor yields rows in header order, so they are streamed straight to the CSV
+        # through a 1 MiB buffer to keep write calls few on large reports.
+        cursor = self._conn().execute(query, (start_date.isoformat(), end_date.isoformat()))
+        with output_file.open("w", newline="", buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(["integration_name", "run_count", "success_count", "error_count", "avg_duration"])
-            for row in results:
-                writer.writerow([
-                    row[0],  # integration_name
-                    row[1],  # run_count
-                    row[2],  # success_count
-                    row[3],  # error_count
-                    row[4]   # avg_duration
-                ])
+            writer.writerows(cursor)
         
         logger.info(f"Generated report: {output_file}")
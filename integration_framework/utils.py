@@ -1,4 +1,17 @@
-def check_docstrings():
-    """Placeholder function to check docstrings in test files."""
-    print("check_docstrings executed")
-    pass
+import functools
+import logging
+import sys
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure root logging for command-line entry points."""
+    logging.basicConfig(level=level, format="%(asctime)s - %(levelname)s - %(message)s")
+
+if sys.flags.optimize:
+    def check_docstrings():
+        """Skip docstring checks when running with -O."""
+        return
+else:
+    @functools.cache
+    def check_docstrings():
+        """Placeholder function to check docstrings in test files."""
+        print("check_docstrings executed")
@@ -1,8 +1,6 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import io
-import sys
-import importlib.machinery
 
 @pytest.fixture(autouse=True)
 def mock_asyncio_sleep():
@@ -10,9 +8,9 @@ def mock_asyncio_sleep():
     with patch("asyncio.sleep", return_value=None):
         yield
 
-@pytest.fixture(autouse=True)
-def mock_file_open(monkeypatch):
-    """Patch builtins.open to avoid file I/O and support YAML/JSON operations."""
+@pytest.fixture(autouse=True, scope="module")
+def mock_file_open():
+    """Patch builtins.open once per module to avoid file I/O and support YAML/JSON operations."""
     file_contents = {}
     def mock_open(file, mode='r', *args, **kwargs):
         if 'w' in mode:
@@ -23,15 +21,6 @@ def mock_file_open(monkeypatch):
             return file_contents[file]
         else:
             return io.StringIO()
-    monkeypatch.setattr("builtins.open", mock_open)
-    yield
-
-@pytest.fixture(autouse=True)
-def mock_importlib(monkeypatch):
-    """Patch importlib to speed up module loading in tests."""
-    def mock_find_spec(name, path=None, target=None):
-        if name.startswith("test_integration_framework"):
-            return MagicMock(spec=importlib.machinery.ModuleSpec)
-        return None
-    monkeypatch.setattr("importlib.util.find_spec", mock_find_spec)
-    yield
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("builtins.open", mock_open)
+        yield
@@ -1,6 +1,7 @@
 import pytest
 import asyncio
 import sys
+import os
 import logging
 import importlib
 from pathlib import Path
@@ -8,27 +9,72 @@ import yaml
 import json
 from datetime import datetime, timedelta
 from integration_framework.batch import BatchRunner
+import integration_framework.batch as batch_module
 from integration_framework.support_manager import SupportManager
 from integration_framework.sql_query_manager import SQLQueryManager
 from integration_framework.telemetry import TelemetryManager
 from integration_framework.integrations import Integration
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from click.testing import CliRunner
 import inspect
+import time
 
-logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 @pytest.fixture
-def runner(tmp_path):
-    """Create a BatchRunner with a temporary integrations directory."""
+def runner(tmp_path, monkeypatch):
+    """Create a BatchRunner with a temporary integrations directory and telemetry database."""
+    monkeypatch.chdir(tmp_path)
     runner = BatchRunner()
-    runner.integrations_dir = tmp_path / "test_integration_framework" / "integrations"
-    runner.integrations_dir.mkdir(parents=True)
-    (tmp_path / "test_integration_framework" / "__init__.py").touch()
-    (runner.integrations_dir / "__init__.py").touch()
+    package = tmp_path / "test_integration_framework"
+    (package / "integrations").mkdir(parents=True)
+    (package / "__init__.py").write_bytes(b"")
+    (package / "integrations" / "__init__.py").write_bytes(b"")
+    runner.integrations_dir = package / "integrations"
     runner._is_test = True
-    return runner
+    yield runner
+    runner.close()
+
+class TestIntegration(Integration):
+    """Minimal integration shared by the load and run tests."""
+    __test__ = False
+    def fetch_data(self): return []
+    def postprocess_data(self, data): return data
+    def deliver_results(self, data): pass
+
+TEST_MODULE = "test_integration_framework.integrations.test_integration"
+
+@pytest.fixture
+def mock_module(monkeypatch):
+    """Install a stand-in integration module exposing TestIntegration in sys.modules."""
+    module = MagicMock()
+    module.TestIntegration = TestIntegration
+    monkeypatch.setitem(sys.modules, TEST_MODULE, module)
+    return module
+
+class FakeSQL:
+    """SQLQueryManager stand-in that serves fixed rows without a database."""
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.connection = None
+    def __enter__(self):
+        self.connection = object()
+        return self
+    def __exit__(self, *exc):
+        self.connection = None
+    def execute_query(self, query, params=None):
+        return iter(self.rows)
+    def fetch_scalar(self, query, params=None):
+        return next(iter(self.rows[0].values())) if self.rows else None
+
+CFG_ENABLED = "enabled: true\n"
+CFG_DISABLED = "enabled: false\n"
+
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+def write_yaml(path, data):
+    """Write data to path as YAML using the libyaml emitter when available."""
+    path.write_text(yaml.dump(data, Dumper=YAML_DUMPER, default_flow_style=False))
 
 def check_docstrings():
     """Verify docstrings for BatchRunner and its public methods."""
@@ -40,10 +86,13 @@ def check_docstrings():
     for method in methods:
         assert method.__doc__, f"Method {method.__name__} missing docstring"
 
-@pytest.mark.asyncio
-async def test_init(runner):
-    """Test BatchRunner.__init__."""
+@pytest.fixture(scope="session", autouse=True)
+def docstrings_checked():
+    """Check BatchRunner docstrings once for the whole test session."""
     check_docstrings()
+
+def test_init(runner):
+    """Test BatchRunner.__init__."""
     assert isinstance(runner.integrations_dir, Path)
     assert isinstance(runner.support, SupportManager)
     assert isinstance(runner.sql_manager, SQLQueryManager)
@@ -51,54 +100,104 @@ async def test_init(runner):
     assert runner.cache_file == Path("validation_cache.json")
     assert runner.cache_ttl == timedelta(hours=24)
 
-def test_load_integration(runner):
+def test_load_integration(runner, mock_module):
     """Test BatchRunner.load_integration."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
     (int_dir / "__init__.py").touch()
+    with patch("importlib.import_module") as mock_import:
+        integration_class = runner.load_integration("test_integration")
+        assert integration_class.__name__ == "TestIntegration"
+        mock_import.assert_not_called()
+
+def test_load_integration_class_name(runner, monkeypatch):
+    """Test BatchRunner.load_integration with class_name in metadata."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "__init__.py").touch()
+    write_yaml(int_dir / "metadata.yaml", {"class_name": "TestIntegration"})
     class TestIntegration(Integration):
-        def __init__(self, config, support, name):
-            super().__init__(config, support, name)
-        def fetch_data(self): pass
-        def postprocess_data(self, data): pass
-        def deliver_results(self, data): pass
+        pass
+    class OtherIntegration(Integration):
+        pass
     mock_module = MagicMock()
     mock_module.TestIntegration = TestIntegration
-    mock_spec = MagicMock()
-    with patch("importlib.util.find_spec", return_value=mock_spec), \
-         patch("importlib.import_module", return_value=mock_module) as mock_import:
-        integration_class = runner.load_integration("test_integration")
-        assert integration_class.__name__ == "TestIntegration"
-        mock_import.assert_called_with("test_integration_framework.integrations.test_integration")
+    mock_module.OtherIntegration = OtherIntegration
+    monkeypatch.setitem(sys.modules, TEST_MODULE, mock_module)
+    assert runner.load_integration("test_integration") is TestIntegration
+
+def test_load_integration_class_export(runner, monkeypatch):
+    """Test BatchRunner.load_integration prefers the module's INTEGRATION_CLASS export."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "__init__.py").touch()
+    class TestIntegration(Integration):
+        pass
+    class OtherIntegration(Integration):
+        pass
+    mock_module = MagicMock()
+    mock_module.OtherIntegration = OtherIntegration
+    mock_module.INTEGRATION_CLASS = TestIntegration
+    monkeypatch.setitem(sys.modules, TEST_MODULE, mock_module)
+    with patch.object(runner, "load_metadata") as mock_metadata:
+        assert runner.load_integration("test_integration") is TestIntegration
+        mock_metadata.assert_not_called()
+
+def test_load_integration_unknown_module(runner):
+    """Test BatchRunner.load_integration skips the import for undiscovered packages."""
+    (runner.integrations_dir / "test_integration").mkdir()
+    with patch("importlib.import_module") as mock_import:
+        assert runner.load_integration("test_integration") is None
+        assert runner.load_integration("nonexistent") is None
+        mock_import.assert_not_called()
+    assert runner.available_modules == frozenset()
 
 def test_load_config(runner):
     """Test BatchRunner.load_config."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
     config_path = int_dir / "config.yaml"
-    with config_path.open("w") as f:
-        yaml.safe_dump({"enabled": True}, f)
+    config_path.write_text(CFG_ENABLED)
     config = runner.load_config("test_integration")
     assert config == {"enabled": True}
     assert runner.load_config("nonexistent") == {}
 
+def test_load_config_reparses_modified_file(runner):
+    """Test BatchRunner.load_config picks up edits despite the parse cache."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    config_path = int_dir / "config.yaml"
+    config_path.write_text(CFG_ENABLED)
+    assert runner.load_config("test_integration") == {"enabled": True}
+    write_yaml(config_path, {"enabled": False, "city": "London"})
+    assert runner.load_config("test_integration") == {"enabled": False, "city": "London"}
+    runner.load_config("test_integration")["city"] = "Paris"
+    assert runner.load_config("test_integration")["city"] == "London"
+
+def test_load_config_json_sidecar(runner):
+    """Test BatchRunner.load_config reads the JSON sidecar instead of re-parsing YAML."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    write_yaml(int_dir / "config.yaml", {"enabled": True, "city": "London"})
+    assert runner.load_config("test_integration") == {"enabled": True, "city": "London"}
+    assert (int_dir / ".config.json").exists()
+    batch_module._yaml_cache.clear()
+    with patch("yaml.load") as mock_load:
+        assert runner.load_config("test_integration") == {"enabled": True, "city": "London"}
+        mock_load.assert_not_called()
+
 def test_load_metadata(runner):
     """Test BatchRunner.load_metadata."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
     metadata_path = int_dir / "metadata.yaml"
-    with metadata_path.open("w") as f:
-        yaml.safe_dump({"version": "1.0.0", "tags": ["test"], "description": "Test integration"}, f)
+    write_yaml(metadata_path, {"version": "1.0.0", "tags": ["test"], "description": "Test integration"})
     metadata = runner.load_metadata("test_integration")
     assert metadata == {"version": "1.0.0", "tags": ["test"], "description": "Test integration"}
     assert runner.load_metadata("nonexistent") == {}
 
 def test_load_validation_cache(runner, tmp_path):
     """Test BatchRunner.load_validation_cache."""
-    check_docstrings()
     runner.cache_file = tmp_path / "validation_cache.json"
     with runner.cache_file.open("w") as f:
         json.dump({"integrations": {"test": {"valid": True, "timestamp": "2025-04-22T10:00:00"}}}, f)
@@ -109,7 +208,6 @@ def test_load_validation_cache(runner, tmp_path):
 
 def test_save_validation_cache(runner, tmp_path):
     """Test BatchRunner.save_validation_cache."""
-    check_docstrings()
     runner.cache_file = tmp_path / "validation_cache.json"
     cache = {"integrations": {"test": {"valid": True, "timestamp": "2025-04-22T10:00:00"}}}
     runner.save_validation_cache(cache)
@@ -117,119 +215,239 @@ def test_save_validation_cache(runner, tmp_path):
         saved = json.load(f)
     assert saved == cache
 
+def test_flush_cache(runner, tmp_path):
+    """Test BatchRunner.flush_cache writes validation results once."""
+    runner.cache_file = tmp_path / "validation_cache.json"
+    runner.flush_cache()
+    assert not runner.cache_file.exists()
+    runner.validation_cache["integrations"]["test"] = {"valid": True, "timestamp": "2025-04-22T10:00:00"}
+    runner.flush_cache()
+    with runner.cache_file.open("r") as f:
+        saved = json.load(f)
+    assert saved == {"integrations": {"test": {"valid": True, "timestamp": "2025-04-22T10:00:00"}}}
+    with patch.object(runner, "_write_cache") as mock_write:
+        runner.flush_cache()
+        mock_write.assert_not_called()
+
 def test_get_last_updated(runner, tmp_path):
     """Test BatchRunner.get_last_updated."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
-    with (int_dir / "metadata.yaml").open("w") as f:
-        yaml.safe_dump({"last_updated": "2025-04-22T10:00:00"}, f)
-    with patch("integration_framework.sql_query_manager.SQLQueryManager") as MockSQL:
-        mock_instance = MockSQL.return_value.__enter__.return_value
-        mock_instance.execute_query.return_value = iter([])
-        timestamp = runner.get_last_updated("test_integration")
-        assert timestamp == "2025-04-22T10:00:00"
-
-def test_validate_integration(runner, tmp_path):
+    write_yaml(int_dir / "metadata.yaml", {"last_updated": "2025-04-22T10:00:00"})
+    runner.sql_manager = FakeSQL()
+    timestamp = runner.get_last_updated("test_integration")
+    assert timestamp == "2025-04-22T10:00:00"
+
+def test_sql_connection_reused(runner, tmp_path):
+    """Test BatchRunner keeps one SQL connection open across lookups until close."""
+    runner.telemetry.log_run_many([("test", "success", 0.1, "2025-04-22T10:00:00", None)])
+    runner.sql_manager = SQLQueryManager(str(runner.telemetry.db_path))
+    assert runner.get_last_updated("test") == "2025-04-22T10:00:00"
+    connection = runner.sql_manager.connection
+    assert connection is not None
+    runner.get_last_updated_bulk(["test"])
+    assert runner.sql_manager.connection is connection
+    runner.close()
+    assert runner.sql_manager.connection is None
+
+def test_flush_cache_merges_concurrent_changes(runner, tmp_path):
+    """Test BatchRunner.flush_cache keeps entries another process wrote after loading."""
+    runner.cache_file = tmp_path / "validation_cache.json"
+    other = BatchRunner()
+    other.cache_file = runner.cache_file
+    runner.validation_cache["integrations"]["a"] = {"valid": True}
+    other.validation_cache["integrations"]["b"] = {"valid": False}
+    other.flush_cache()
+    runner.flush_cache()
+    assert json.loads(runner.cache_file.read_text())["integrations"] == {
+        "a": {"valid": True},
+        "b": {"valid": False}
+    }
+
+def test_validation_cache_refreshes_on_change(runner, tmp_path):
+    """Test BatchRunner.validation_cache picks up entries written by another process."""
+    runner.cache_file = tmp_path / "validation_cache.json"
+    runner.validation_cache["integrations"]["a"] = {"valid": True}
+    other = BatchRunner()
+    other.cache_file = runner.cache_file
+    other.validation_cache["integrations"]["b"] = {"valid": False}
+    other.flush_cache()
+    with patch.object(runner, "load_validation_cache", wraps=runner.load_validation_cache) as mock_load:
+        assert runner.validation_cache["integrations"] == {"a": {"valid": True}, "b": {"valid": False}}
+        assert runner.validation_cache["integrations"]["b"] == {"valid": False}
+        assert mock_load.call_count == 1
+    runner.flush_cache()
+    assert json.loads(runner.cache_file.read_text())["integrations"]["a"] == {"valid": True}
+
+def test_get_last_updated_bulk(runner):
+    """Test BatchRunner.get_last_updated_bulk."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    write_yaml(int_dir / "metadata.yaml", {"last_updated": "2025-04-22T10:00:00"})
+    last_updated = runner.get_last_updated_bulk(["test_integration", "nonexistent"])
+    assert last_updated == {"test_integration": "2025-04-22T10:00:00", "nonexistent": "N/A"}
+
+def test_filter_integrations_large_metadata(runner):
+    """Test BatchRunner.filter_integrations reads the whole metadata file, blank lines included."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "__init__.py").touch()
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    (int_dir / "metadata.yaml").write_text("tags:\n  - first\n\n  - second\n\nnotes: " + "x" * 8192 + "\n")
+    assert runner.filter_integrations(tags=["second"])[0] == ["test_integration"]
+
+def test_validate_integration(runner, tmp_path, mock_module):
     """Test BatchRunner.validate_integration."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
-    with (int_dir / "config.yaml").open("w") as f:
-        yaml.safe_dump({"enabled": True}, f)
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
     (int_dir / "__init__.py").touch()
+    runner.cache_file = tmp_path / "validation_cache.json"
+    assert runner.validate_integration("test_integration") == True
+
+def test_validate_integration_shallow(runner, tmp_path):
+    """Test BatchRunner.validate_integration without importing the integration."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    runner.cache_file = tmp_path / "validation_cache.json"
+    with patch.object(runner, "load_integration") as mock_load:
+        assert runner.validate_integration("test_integration", deep=False) == False
+        (int_dir / "__init__.py").touch()
+        assert runner.validate_integration("test_integration", deep=False) == True
+        mock_load.assert_not_called()
+    assert not runner.cache_file.exists()
+
+def test_validate_integration_config_schema(runner, tmp_path):
+    """Test BatchRunner.validate_integration rejects malformed configs and re-checks edits."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "__init__.py").touch()
+    config_path = int_dir / "config.yaml"
+    write_yaml(config_path, {"enabled": "yes"})
+    runner.cache_file = tmp_path / "validation_cache.json"
+    with patch.object(runner, "load_integration") as mock_load:
+        assert runner.validate_integration("test_integration") == False
+        mock_load.assert_not_called()
+    config_path.write_text(CFG_DISABLED)
+    os.utime(config_path, ns=(0, 0))
+    assert runner.validate_integration("test_integration") == True
+
+def test_run_integration(runner, mock_module):
+    """Test BatchRunner.run_integration."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    (int_dir / "__init__.py").touch()
+    with patch.object(runner, "load_config", return_value={"enabled": True}):
+        with patch.object(runner.support, "notify") as mock_notify, \
+             patch.object(runner.telemetry, "log_run") as mock_telemetry:
+            runner.run_integration("test_integration")
+            mock_notify.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_run_integration_coroutine_fetch(runner, monkeypatch):
+    """Test BatchRunner.run_integration and run_integration_async with a coroutine fetch_data."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "__init__.py").touch()
+    delivered = []
     class TestIntegration(Integration):
-        def __init__(self, config, support, name):
-            super().__init__(config, support, name)
-        def fetch_data(self): pass
-        def postprocess_data(self, data): pass
-        def deliver_results(self, data): pass
+        async def fetch_data(self): return {"message": "hello"}
+        def postprocess_data(self, data): return data["message"]
+        def deliver_results(self, data): delivered.append(data)
     mock_module = MagicMock()
-    mock_module.TestIntegration = TestIntegration
-    mock_spec = MagicMock()
-    with patch("importlib.util.find_spec", return_value=mock_spec), \
-         patch("importlib.import_module", return_value=mock_module):
-        runner.cache_file = tmp_path / "validation_cache.json"
-        assert runner.validate_integration("test_integration") == True
+    mock_module.INTEGRATION_CLASS = TestIntegration
+    monkeypatch.setitem(sys.modules, TEST_MODULE, mock_module)
+    with patch.object(runner, "load_config", return_value={"enabled": True}), \
+         patch.object(runner.support, "notify"):
+        row = await runner.run_integration_async("test_integration", log_telemetry=False)
+        assert row[:2] == ("test_integration", "success")
+        row = await asyncio.to_thread(runner.run_integration, "test_integration", log_telemetry=False)
+        assert row[:2] == ("test_integration", "success")
+    assert delivered == ["hello", "hello"]
 
-def test_run_integration(runner):
-    """Test BatchRunner.run_integration."""
-    check_docstrings()
+@pytest.mark.asyncio
+async def test_run_integration_async_gathered_runs_overlap(runner, monkeypatch):
+    """Test gathered run_integration_async calls overlap, including a blocking completion notice."""
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
-    with (int_dir / "config.yaml").open("w") as f:
-        yaml.safe_dump({"enabled": True}, f)
     (int_dir / "__init__.py").touch()
     class TestIntegration(Integration):
-        def __init__(self, config, support, name):
-            super().__init__(config, support, name)
-        def fetch_data(self): return []
+        async def fetch_data(self): await asyncio.sleep(0.1)
         def postprocess_data(self, data): return data
         def deliver_results(self, data): pass
     mock_module = MagicMock()
-    mock_module.TestIntegration = TestIntegration
-    mock_spec = MagicMock()
-    with patch("importlib.util.find_spec", return_value=mock_spec), \
-         patch("importlib.import_module", return_value=mock_module), \
-         patch.object(runner, "load_config", return_value={"enabled": True}):
-        with patch.object(runner.support, "notify") as mock_notify, \
-             patch.object(runner.telemetry, "log_run") as mock_telemetry:
-            runner.run_integration("test_integration")
-            mock_notify.assert_called_once()
+    mock_module.INTEGRATION_CLASS = TestIntegration
+    monkeypatch.setitem(sys.modules, TEST_MODULE, mock_module)
+    with patch.object(runner, "load_config", return_value={"enabled": True}), \
+         patch.object(runner.support, "notify", side_effect=lambda message: time.sleep(0.2)):
+        start = time.perf_counter()
+        rows = await asyncio.gather(*(
+            runner.run_integration_async("test_integration", log_telemetry=False) for _ in range(4)
+        ))
+        elapsed = time.perf_counter() - start
+    assert [row[1] for row in rows] == ["success"] * 4
+    assert elapsed < 0.6
+
+def test_run_filtered_sequential_coroutine_fetch(runner, monkeypatch):
+    """Test run_filtered without parallelism awaits coroutine fetch_data on the running loop."""
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "__init__.py").touch()
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    delivered = []
+    class TestIntegration(Integration):
+        async def fetch_data(self): return {"message": "hello"}
+        def postprocess_data(self, data): return data["message"]
+        def deliver_results(self, data): delivered.append(data)
+    mock_module = MagicMock()
+    mock_module.INTEGRATION_CLASS = TestIntegration
+    monkeypatch.setitem(sys.modules, TEST_MODULE, mock_module)
+    with patch.object(runner.support, "notify"), \
+         patch.object(runner.telemetry, "log_run_many") as mock_log_run_many:
+        asyncio.run(runner.run_filtered(name="test_integration", parallel="none"))
+    assert delivered == ["hello"]
+    rows = mock_log_run_many.call_args.args[0]
+    assert [(row[0], row[1], row[4]) for row in rows] == [("test_integration", "success", None)]
 
 def test_get_integrations(runner):
     """Test BatchRunner.get_integrations."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
-    with (int_dir / "__init__.py").open("w") as f:
-        f.write("")
-    with (int_dir / "config.yaml").open("w") as f:
-        yaml.safe_dump({"enabled": True}, f)
+    (int_dir / "__init__.py").touch()
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
     integrations = runner.get_integrations()
     assert integrations == ["test_integration"]
 
-@pytest.mark.asyncio
-async def test_run_filtered(runner):
+def test_run_filtered(runner, mock_module):
     """Test BatchRunner.run_filtered."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
-    with (int_dir / "config.yaml").open("w") as f:
-        yaml.safe_dump({"enabled": True}, f)
-    with (int_dir / "metadata.yaml").open("w") as f:
-        yaml.safe_dump({"tags": ["test"], "description": "Test integration"}, f)
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    write_yaml(int_dir / "metadata.yaml", {"tags": ["test"], "description": "Test integration"})
     (int_dir / "__init__.py").touch()
-    class TestIntegration(Integration):
-        def __init__(self, config, support, name):
-            super().__init__(config, support, name)
-        def fetch_data(self): return []
-        def postprocess_data(self, data): return data
-        def deliver_results(self, data): pass
-    mock_module = MagicMock()
-    mock_module.TestIntegration = TestIntegration
-    mock_spec = MagicMock()
-    with patch("importlib.util.find_spec", return_value=mock_spec), \
-         patch("importlib.import_module", return_value=mock_module):
-        with patch.object(runner.support, "notify") as mock_notify:
-            await runner.run_filtered(name="test_integration", parallel="asyncio")
-            mock_notify.assert_called_once()
+    with patch.object(runner.support, "notify") as mock_notify, \
+         patch.object(runner.telemetry, "log_run") as mock_log_run, \
+         patch.object(runner.telemetry, "log_run_many") as mock_log_run_many:
+        asyncio.run(runner.run_filtered(name="test_integration", parallel="asyncio"))
+        mock_notify.assert_called_once()
+        mock_log_run.assert_not_called()
+        rows = mock_log_run_many.call_args.args[0]
+        assert [(row[0], row[1]) for row in rows] == [("test_integration", "success")]
 
 def test_filter_integrations(runner):
     """Test BatchRunner.filter_integrations."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
-    with (int_dir / "config.yaml").open("w") as f:
-        yaml.safe_dump({"enabled": True}, f)
-    with (int_dir / "metadata.yaml").open("w") as f:
-        yaml.safe_dump({
-            "tags": ["test"],
-            "business_contact": "jane.doe@client.com",
-            "technical_contact": "john.smith@client.com",
-            "description": "Test integration",
-            "last_updated": "2025-04-22T10:00:00"
-        }, f)
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    write_yaml(int_dir / "metadata.yaml", {
+        "tags": ["test"],
+        "business_contact": "jane.doe@client.com",
+        "technical_contact": "john.smith@client.com",
+        "description": "Test integration",
+        "last_updated": "2025-04-22T10:00:00"
+    })
     (int_dir / "__init__.py").touch()
     integrations, hash_value = runner.filter_integrations(
         partial_name="test",
@@ -240,36 +458,120 @@ def test_filter_integrations(runner):
     assert integrations == ["test_integration"]
     assert len(hash_value) == 8
 
+def test_filter_integrations_name_shortcut(runner):
+    """Test BatchRunner.filter_integrations applies name criteria before reading metadata."""
+    for name in ("hello_world", "weather_news"):
+        int_dir = runner.integrations_dir / name
+        int_dir.mkdir()
+        (int_dir / "__init__.py").touch()
+        (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    with patch.object(runner, "load_metadata", return_value={}) as mock_header:
+        assert runner.filter_integrations(name="weather_news")[0] == ["weather_news"]
+        assert runner.filter_integrations(name="missing")[0] == []
+        assert runner.filter_integrations(partial_name="hello*d")[0] == ["hello_world"]
+        assert {call.args[0] for call in mock_header.call_args_list} == {"weather_news", "hello_world"}
+
+def test_filter_integrations_persisted(runner, tmp_path):
+    """Test BatchRunner.filter_integrations reuses stored results and run_filtered resolves hashes."""
+    runner.cache_file = tmp_path / "validation_cache.json"
+    int_dir = runner.integrations_dir / "test_integration"
+    int_dir.mkdir()
+    (int_dir / "__init__.py").touch()
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    (int_dir / "metadata.yaml").write_text("tags:\n  - test\n")
+    filtered, criteria_hash = runner.filter_integrations(tags=["test"])
+    assert filtered == ["test_integration"]
+    with patch.object(runner, "load_metadata") as mock_header:
+        assert runner.filter_integrations(tags=["test"]) == (filtered, criteria_hash)
+        mock_header.assert_not_called()
+    with patch.object(runner, "run_integration_async", new_callable=AsyncMock, return_value=None) as mock_run:
+        asyncio.run(runner.run_filtered(criteria_hash=criteria_hash))
+        mock_run.assert_called_once_with("test_integration", False, log_telemetry=False)
+        mock_run.reset_mock()
+        asyncio.run(runner.run_filtered(criteria_hash="unknown"))
+        mock_run.assert_not_called()
+
+def test_filter_cache_bounded(runner, tmp_path, monkeypatch):
+    """Test BatchRunner keeps only the most recently stored filters, and no results for date bounds."""
+    monkeypatch.setattr(batch_module, "_FILTER_CACHE_SIZE", 3)
+    runner.cache_file = tmp_path / "validation_cache.json"
+    hashes = [runner.filter_integrations(name=f"integration_{i}")[1] for i in range(5)]
+    dated_hash = runner.filter_integrations(last_updated_after="2025-01-01")[1]
+    runner.flush_cache()
+    filters = json.loads(runner.cache_file.read_text())["filters"]
+    assert list(filters) == hashes[3:] + [dated_hash]
+    assert list(filters[dated_hash]) == ["criteria"]
+    assert filters[dated_hash]["criteria"]["last_updated_after"] == "2025-01-01"
+    assert filters[hashes[4]]["integrations"] == []
+
 def test_list_integrations(runner, capsys):
     """Test BatchRunner.list_integrations."""
-    check_docstrings()
     int_dir = runner.integrations_dir / "test_integration"
     int_dir.mkdir()
-    with (int_dir / "config.yaml").open("w") as f:
-        yaml.safe_dump({"enabled": True}, f)
-    with (int_dir / "__init__.py").open("w") as f:
-        f.write("")
-    with (int_dir / "metadata.yaml").open("w") as f:
-        yaml.safe_dump({
-            "business_contact": "jane.doe@client.com",
-            "technical_contact": "john.smith@client.com",
-            "tags": ["test"],
-            "description": "Test integration",
-            "version": "1.0.0",
-            "last_updated": "2025-04-22T10:00:00"
-        }, f)
-    with patch("integration_framework.sql_query_manager.SQLQueryManager") as MockSQL:
-        mock_instance = MockSQL.return_value.__enter__.return_value
-        mock_instance.execute_query.return_value = iter([{"MAX(timestamp)": "2025-04-22T10:00:00"}])
-        runner.list_integrations(partial_name="test")
-        captured = capsys.readouterr()
-        assert "test_integration" in captured.out
-        assert "jane.doe@client.com" in captured.out
-        assert "Criteria Hash" in captured.out
+    (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    (int_dir / "__init__.py").touch()
+    write_yaml(int_dir / "metadata.yaml", {
+        "business_contact": "jane.doe@client.com",
+        "technical_contact": "john.smith@client.com",
+        "tags": ["test"],
+        "description": "Test integration",
+        "version": "1.0.0",
+        "last_updated": "2025-04-22T10:00:00"
+    })
+    runner.sql_manager = FakeSQL([{"integration_name": "test_integration", "last_run": "2025-04-23T10:00:00"}])
+    runner.list_integrations(partial_name="test")
+    captured = capsys.readouterr()
+    assert "test_integration" in captured.out
+    assert "jane.doe@client.com" in captured.out
+    assert "2025-04-23T10:00:00" in captured.out
+    assert "Criteria Hash" in captured.out
+
+def test_validate(runner, caplog):
+    """Test BatchRunner.validate logs results in directory order and flushes once."""
+    for name in ("a_integration", "b_integration"):
+        int_dir = runner.integrations_dir / name
+        int_dir.mkdir()
+        (int_dir / "__init__.py").touch()
+        (int_dir / "config.yaml").write_text(CFG_ENABLED)
+    names = runner.get_integrations()
+    with patch.object(runner, "validate_integration", side_effect=lambda name: name == "a_integration"), \
+         patch.object(runner, "flush_cache") as mock_flush, \
+         caplog.at_level(logging.INFO):
+        runner.validate()
+    messages = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Integration ")]
+    expected = {"a_integration": "valid", "b_integration": "invalid"}
+    assert messages == [f"Integration {name} is {expected[name]}" for name in names]
+    mock_flush.assert_called_once()
+
+def test_validate_keeps_results_when_cache_refreshes(runner, tmp_path):
+    """Test BatchRunner.validate keeps every result while another process rewrites the cache."""
+    names = [f"integration_{i}" for i in range(20)]
+    for name in names:
+        int_dir = runner.integrations_dir / name
+        int_dir.mkdir()
+        (int_dir / "__init__.py").touch()
+        (int_dir / "config.yaml").write_text(CFG_DISABLED)
+    runner.cache_file = tmp_path / "validation_cache.json"
+    other = BatchRunner()
+    other.cache_file = runner.cache_file
+    load_config = runner.load_config
+
+    def load_config_and_refresh(name):
+        other.validation_cache["integrations"][f"other_{name}"] = {"valid": True}
+        other.flush_cache()
+        # Picks up the rewritten file and merges it before this entry is stored.
+        runner.validation_cache
+        return load_config(name)
+
+    with patch.object(runner, "load_config", side_effect=load_config_and_refresh):
+        runner.validate()
+    integrations = json.loads(runner.cache_file.read_text())["integrations"]
+    assert all(integrations[name]["valid"] for name in names)
+    assert all(f"other_{name}" in integrations for name in names)
+    other.close()
 
 def test_report_issue(runner, capsys):
     """Test BatchRunner.report_issue."""
-    check_docstrings()
     with patch.object(runner.support, "report_issue") as mock_report:
         runner.report_issue("bug", "Test issue", "test_integration")
         mock_report.assert_called_once_with("bug", "Test issue", "test_integration")
@@ -278,7 +580,28 @@ def test_report_issue(runner, capsys):
 
 def test_generate_telemetry_report(runner, tmp_path):
     """Test BatchRunner.generate_telemetry_report."""
-    check_docstrings()
     with patch.object(runner.telemetry, "generate_report") as mock_report:
         runner.generate_telemetry_report("2025-04")
         mock_report.assert_called_once_with("2025-04")
+
+def test_cli_run_pretty_cache():
+    """Test the run command passes the group-level --pretty-cache flag to BatchRunner."""
+    with patch.object(batch_module, "BatchRunner") as mock_runner_class:
+        mock_runner_class.return_value.run_filtered = AsyncMock()
+        result = CliRunner().invoke(batch_module.cli, ["--pretty-cache", "run", "--name", "hello_world"])
+    assert result.exit_code == 0, result.output
+    mock_runner_class.assert_called_once_with(pretty_cache=True)
+    mock_runner_class.return_value.close.assert_called_once()
+
+@pytest.mark.parametrize("args, method", [
+    (["run"], "run_filtered"),
+    (["list"], "list_integrations"),
+    (["validate"], "validate")
+])
+def test_cli_closes_runner_on_error(args, method):
+    """Test the run, list and validate commands close the runner even when the command fails."""
+    with patch.object(batch_module, "BatchRunner") as mock_runner_class:
+        setattr(mock_runner_class.return_value, method, MagicMock(side_effect=RuntimeError("boom")))
+        result = CliRunner().invoke(batch_module.cli, args)
+    assert isinstance(result.exception, RuntimeError)
+    mock_runner_class.return_value.close.assert_called_once()
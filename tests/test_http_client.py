@@ -3,6 +3,7 @@ import time
 from unittest.mock import patch, MagicMock
 import httpx
 from vendor.http_client import HttpClient, HttpResponse
+import vendor.http_client.http_client as http_client_module
 from integration_framework.utils import check_docstrings
 
 @pytest.fixture
@@ -72,3 +73,76 @@ def test_configurable_backoff():
     with patch.object(client.client, 'request', side_effect=mock_responses),          patch('random.uniform', return_value=0.0):
         response = client.get("http://example.com")
         assert response.status_code == 200
+
+def test_request_many(http_client):
+    """Test request_many returns responses in submission order over the shared client."""
+    def respond(method, url, headers=None, content=None, timeout=None):
+        return MagicMock(status_code=int(url.rsplit("/", 1)[1]), content=b"", headers={}, request=None)
+    with patch.object(http_client.client, 'request', side_effect=respond) as mock_request:
+        responses = http_client.request_many([("GET", f"http://example.com/{code}") for code in (200, 201, 204)])
+        assert [response.status_code for response in responses] == [200, 201, 204]
+        assert mock_request.call_count == 3
+    assert http_client.request_many([]) == []
+
+def test_decorrelated_jitter_delays(http_client):
+    """Test retries sleep uniform(initial_delay, previous * multiplier), capped at max_delay."""
+    http_client.max_delay = 3.0
+    mock_responses = [MagicMock(status_code=429, content=b"", headers={}, request=None)] * 3 + [
+        MagicMock(status_code=200, content=b"", headers={}, request=None)
+    ]
+    with patch.object(http_client.client, 'request', side_effect=mock_responses), \
+         patch('random.uniform', side_effect=lambda low, high: high) as mock_uniform, \
+         patch('time.sleep') as mock_sleep:
+        assert http_client.get("http://example.com").status_code == 200
+    assert [c.args for c in mock_uniform.call_args_list] == [(1.0, 2.0), (1.0, 4.0), (1.0, 6.0)]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 3.0, 3.0]
+
+def test_no_jitter_delays():
+    """Test jitter_factor=0 retries with plain exponential delays, capped at max_delay."""
+    client = HttpClient(initial_delay=1.0, multiplier=2.0, max_delay=6.0, jitter_factor=0)
+    mock_responses = [MagicMock(status_code=429, content=b"", headers={}, request=None)] * 3 + [
+        MagicMock(status_code=200, content=b"", headers={}, request=None)
+    ]
+    with patch.object(client.client, 'request', side_effect=mock_responses), \
+         patch('random.uniform') as mock_uniform, \
+         patch('time.sleep') as mock_sleep:
+        assert client.get("http://example.com").status_code == 200
+    mock_uniform.assert_not_called()
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 4.0, 6.0]
+
+def test_retry_transient_server_errors(http_client):
+    """Test 5xx gateway errors are retried but other errors are returned immediately."""
+    mock_responses = [
+        MagicMock(status_code=503, content=b"", headers={}, request=None),
+        MagicMock(status_code=502, content=b"", headers={}, request=None),
+        MagicMock(status_code=404, content=b"", headers={}, request=None),
+    ]
+    with patch.object(http_client.client, 'request', side_effect=mock_responses) as mock_request, \
+         patch('time.sleep'):
+        assert http_client.get("http://example.com").status_code == 404
+        assert mock_request.call_count == 3
+
+def test_get_many(http_client):
+    """Test get_many issues GET requests and preserves URL order."""
+    def respond(method, url, headers=None, content=None, timeout=None):
+        return MagicMock(status_code=200, content=url.encode(), headers={}, request=None)
+    urls = [f"http://example.com/{i}" for i in range(5)]
+    with patch.object(http_client.client, 'request', side_effect=respond) as mock_request:
+        responses = http_client.get_many(urls)
+    assert [response.content.decode() for response in responses] == urls
+    assert {c.args[0] for c in mock_request.call_args_list} == {"GET"}
+
+def test_client_shared_across_instances(http_client):
+    """Test every HttpClient uses one pooled httpx client that only shutdown() closes."""
+    other = HttpClient(timeout=10)
+    assert other.client is http_client.client
+    mock_response = MagicMock(status_code=200, content=b"", headers={}, request=None)
+    with patch.object(http_client.client, 'request', return_value=mock_response) as mock_request:
+        other.get("http://example.com")
+        assert mock_request.call_args.kwargs["timeout"] == 10
+    shared = http_client.client
+    other.close()
+    assert not shared.is_closed and http_client.client is shared
+    http_client_module.shutdown()
+    assert shared.is_closed
+    assert http_client.client is not shared and not http_client.client.is_closed
@@ -1,61 +1,31 @@
 import pytest
-from unittest.mock import MagicMock
+import sqlite3
 from collections import namedtuple
 
 @pytest.fixture
 def test_db(tmp_path):
-    """Create a mock SQLite database for testing."""
-    mock_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.execute.side_effect = [
-        None,  # CREATE TABLE
-        None,  # INSERT
-        None,  # COMMIT
-        None,  # SELECT id, timestamp (params0)
-        None,  # SELECT id, timestamp (params1)
-        None,  # SELECT id, timestamp, integration_name
-        None,  # SELECT id (empty)
-        None,  # INSERT in test_exit
-    ]
-    mock_cursor.fetchall.side_effect = [
-        [(1, "2025-04-22T10:00:00")],  # SELECT id, timestamp (params0)
-        [(1, "2025-04-22T10:00:00")],  # SELECT id, timestamp (params1)
-        [(1, "2025-04-22T10:00:00", "test")],  # SELECT id, timestamp, integration_name
-        [],  # SELECT id (empty)
-    ]
-    default_description = [
-        ("id", None, None, None, None, None, None),
-        ("timestamp", None, None, None, None, None, None)
-    ]
-    namedtuple_description = [
-        ("id", None, None, None, None, None, None),
-        ("max_timestamp", None, None, None, None, None, None),
-        ("integration_name", None, None, None, None, None, None)
-    ]
-
-    def dynamic_description(*args, **kwargs):
-        query = args[0] if args and args[0] else ""
-        if "max_timestamp" in query.lower():
-            return namedtuple_description
-        return default_description
-
-    mock_cursor.description = property(dynamic_description)
-    return mock_conn
+    """Create a SQLite database with a single telemetry row for testing."""
+    path = str(tmp_path / "telemetry.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE telemetry (id INTEGER PRIMARY KEY, timestamp TEXT, integration_name TEXT)")
+    conn.execute("INSERT INTO telemetry VALUES (?, ?, ?)", (1, "2025-04-22T10:00:00", "test"))
+    conn.commit()
+    conn.close()
+    return path
 
 def test_init(test_db):
     from integration_framework.sql_query_manager import SQLQueryManager
-    with SQLQueryManager(":memory:") as mgr:
+    with SQLQueryManager(test_db) as mgr:
         assert mgr is not None
 
 def test_enter(test_db):
     from integration_framework.sql_query_manager import SQLQueryManager
-    with SQLQueryManager(":memory:") as mgr:
+    with SQLQueryManager(test_db) as mgr:
         assert mgr.cursor is not None
 
 def test_exit(test_db):
     from integration_framework.sql_query_manager import SQLQueryManager
-    with SQLQueryManager(":memory:") as mgr:
+    with SQLQueryManager(test_db) as mgr:
         pass
     assert mgr.connection is None
 
@@ -65,7 +35,7 @@ def test_exit(test_db):
 ])
 def test_execute_query(test_db, params, query):
     from integration_framework.sql_query_manager import SQLQueryManager
-    with SQLQueryManager(":memory:") as mgr:
+    with SQLQueryManager(test_db) as mgr:
         results = list(mgr.execute_query(query, params))
     assert isinstance(results, list)
     if results:
@@ -74,7 +44,7 @@ def test_execute_query(test_db, params, query):
 def test_execute_query_context_error(test_db):
     from integration_framework.sql_query_manager import SQLQueryManager
     try:
-        with SQLQueryManager(":memory:"):
+        with SQLQueryManager(test_db):
             raise ValueError("Test error")
     except ValueError:
         assert True
@@ -85,7 +55,7 @@ def test_execute_query_context_error(test_db):
 ])
 def test_execute_query_as_namedtuple(test_db, params, query, expected_fields):
     from integration_framework.sql_query_manager import SQLQueryManager
-    with SQLQueryManager(":memory:") as mgr:
+    with SQLQueryManager(test_db) as mgr:
         results = list(mgr.execute_query_as_namedtuple(query, params))
     assert isinstance(results, list)
     if results:
@@ -93,14 +63,162 @@ def test_execute_query_as_namedtuple(test_db, params, query, expected_fields):
 
 def test_execute_query_as_namedtuple_empty(test_db):
     from integration_framework.sql_query_manager import SQLQueryManager
-    with SQLQueryManager(":memory:") as mgr:
+    with SQLQueryManager(test_db) as mgr:
         results = list(mgr.execute_query_as_namedtuple("SELECT id FROM telemetry WHERE id = ?", [999]))
     assert results == []
 
+def test_execute_query_as_namedtuple_class_cached(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    with SQLQueryManager(test_db) as mgr:
+        first = list(mgr.execute_query_as_namedtuple("SELECT MAX(id), timestamp FROM telemetry"))
+        second = list(mgr.execute_query_as_namedtuple("SELECT MAX(id), timestamp FROM telemetry"))
+    assert first[0]._fields == ("MAX_id_", "timestamp")
+    assert type(first[0]) is type(second[0])
+
 def test_execute_query_as_namedtuple_context_error(test_db):
     from integration_framework.sql_query_manager import SQLQueryManager
     try:
-        with SQLQueryManager(":memory:"):
+        with SQLQueryManager(test_db):
             raise ValueError("Test error")
     except ValueError:
-        assert True
\ No newline at end of file
+        assert True
+
+def test_fetch_scalar(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    with SQLQueryManager(test_db) as mgr:
+        assert mgr.fetch_scalar("SELECT MAX(timestamp) AS ts FROM telemetry WHERE integration_name = ?", ["test"]) == "2025-04-22T10:00:00"
+        assert mgr.fetch_scalar("SELECT id FROM telemetry WHERE id = ?", [999]) is None
+
+def test_configure_connection(tmp_path):
+    import sqlite3
+    from integration_framework.sql_query_manager import configure_connection
+    conn = configure_connection(sqlite3.connect(tmp_path / "telemetry.db"))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -8000
+    finally:
+        conn.close()
+
+def test_enter_leaves_database_untouched(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    with SQLQueryManager(test_db) as mgr:
+        assert mgr.fetch_scalar("SELECT COUNT(*) FROM telemetry") == 1
+        assert not mgr.connection.in_transaction
+
+def test_connection_pooled(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    with SQLQueryManager(test_db) as mgr:
+        first = mgr.connection
+    with SQLQueryManager(test_db) as mgr:
+        assert mgr.connection is first
+    SQLQueryManager.shutdown()
+    with SQLQueryManager(test_db) as mgr:
+        assert mgr.connection is not first
+        assert mgr.fetch_scalar("SELECT COUNT(*) FROM telemetry") == 1
+
+def test_execute_query_errors(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    mgr = SQLQueryManager(test_db)
+    with pytest.raises(ValueError):
+        mgr.execute_query("SELECT id FROM telemetry")
+    with mgr:
+        with pytest.raises(sqlite3.OperationalError, match="no such table"):
+            list(mgr.execute_query("SELECT id FROM missing"))
+
+def test_execute_many(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    with SQLQueryManager(test_db) as mgr:
+        count = mgr.execute_many(
+            "INSERT INTO telemetry (timestamp, integration_name) VALUES (?, ?)",
+            [("2025-04-23T10:00:00", "a"), ("2025-04-24T10:00:00", "b")]
+        )
+        assert count == 2
+    with SQLQueryManager(test_db) as mgr:
+        assert mgr.fetch_scalar("SELECT COUNT(*) FROM telemetry") == 3
+
+def test_result_cache(test_db, monkeypatch):
+    import integration_framework.sql_query_manager as sql_module
+    from integration_framework.sql_query_manager import SQLQueryManager
+    monkeypatch.setattr(sql_module, "_RESULT_CACHE_TTL", 60.0)
+    query = "SELECT id, integration_name FROM telemetry ORDER BY id"
+    with SQLQueryManager(test_db) as mgr:
+        assert list(mgr.execute_query(query)) == [{"id": 1, "integration_name": "test"}]
+        cached = sql_module._POOL.result_caches[test_db]
+        assert len(cached._entries) == 1
+        rows = list(mgr.execute_query_as_namedtuple(query))
+        assert rows[0].integration_name == "test"
+        assert len(cached._entries) == 1
+    conn = sqlite3.connect(test_db)
+    conn.execute("INSERT INTO telemetry VALUES (?, ?, ?)", (2, "2025-04-23T10:00:00", "other"))
+    conn.commit()
+    conn.close()
+    with SQLQueryManager(test_db) as mgr:
+        assert [row["id"] for row in mgr.execute_query(query)] == [1, 2]
+        mgr.execute_many("DELETE FROM telemetry WHERE id = ?", [(2,)])
+        assert [row["id"] for row in mgr.execute_query(query)] == [1]
+
+def test_execute_query_as_rows(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    with SQLQueryManager(test_db) as mgr:
+        rows = list(mgr.execute_query_as_rows("SELECT id, integration_name FROM telemetry WHERE id = ?", [1]))
+        assert isinstance(rows[0], sqlite3.Row)
+        assert rows[0]["integration_name"] == "test" and rows[0][0] == 1
+        assert list(mgr.execute_query("SELECT id FROM telemetry")) == [{"id": 1}]
+    with pytest.raises(ValueError):
+        list(SQLQueryManager(test_db).execute_query_as_rows("SELECT 1"))
+
+def test_execute_query_columnar(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    with SQLQueryManager(test_db) as mgr:
+        mgr.execute_many("INSERT INTO telemetry VALUES (?, ?, ?)", [(2, "2025-04-23T10:00:00", "other")])
+        assert mgr.execute_query_columnar("SELECT id, integration_name FROM telemetry ORDER BY id") == {
+            "id": [1, 2],
+            "integration_name": ["test", "other"]
+        }
+        assert mgr.execute_query_columnar("SELECT id FROM telemetry WHERE id = ?", [3]) == {"id": []}
+
+def test_aexecute_query(test_db):
+    import asyncio
+    from integration_framework.sql_query_manager import SQLQueryManager
+    async def collect(mgr, query, params=None):
+        return [row async for row in mgr.aexecute_query(query, params)]
+    with SQLQueryManager(test_db) as mgr:
+        rows = asyncio.run(collect(mgr, "SELECT id, integration_name FROM telemetry WHERE id = ?", [1]))
+        assert rows == [{"id": 1, "integration_name": "test"}]
+        with pytest.raises(sqlite3.OperationalError):
+            asyncio.run(collect(mgr, "SELECT * FROM missing"))
+    with pytest.raises(ValueError):
+        SQLQueryManager(test_db).aexecute_query("SELECT 1")
+
+def test_pooled_connection_bound_to_thread(test_db):
+    import threading
+    from integration_framework.sql_query_manager import SQLQueryManager
+    errors = []
+    with SQLQueryManager(test_db) as mgr:
+        def query():
+            try:
+                mgr.fetch_scalar("SELECT COUNT(*) FROM telemetry")
+            except sqlite3.ProgrammingError as e:
+                errors.append(e)
+        thread = threading.Thread(target=query)
+        thread.start()
+        thread.join()
+    assert len(errors) == 1
+
+def test_streamed_results_survive_nested_queries(test_db):
+    from integration_framework.sql_query_manager import SQLQueryManager
+    with SQLQueryManager(test_db) as mgr:
+        mgr.execute_many(
+            "INSERT INTO telemetry (timestamp, integration_name) VALUES (?, ?)",
+            [("2025-04-23T10:00:00", f"bulk_{i}") for i in range(2999)]
+        )
+        query = "SELECT id FROM telemetry ORDER BY id"
+        for execute in (mgr.execute_query, mgr.execute_query_as_namedtuple, mgr.execute_query_as_rows):
+            count = 0
+            for _ in execute(query):
+                if count == 0:
+                    assert mgr.fetch_scalar("SELECT COUNT(*) FROM telemetry") == 3000
+                    assert list(mgr.execute_query("SELECT id FROM telemetry WHERE id = ?", [1])) == [{"id": 1}]
+                count += 1
+            assert count == 3000
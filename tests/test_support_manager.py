@@ -14,16 +14,16 @@ def test_log_with_backoff(support_manager, caplog):
     caplog.set_level(logging.ERROR)
     key = "test_error"
     message = "Test error message"
-    with patch("time.time", return_value=1000.0):
+    with patch("time.monotonic", return_value=1000.0):
         result, _ = support_manager.log_with_backoff(key, message, level="error")
         assert result is True
         assert message in caplog.text
     caplog.clear()
-    with patch("time.time", return_value=1000.5):
+    with patch("time.monotonic", return_value=1000.5):
         result, _ = support_manager.log_with_backoff(key, message, level="error")
         assert result is False
         assert message not in caplog.text
-    with patch("time.time", return_value=1001.1):
+    with patch("time.monotonic", return_value=1001.1):
         result, _ = support_manager.log_with_backoff(key, message, level="error")
         assert result is True
 
@@ -31,7 +31,7 @@ def test_notify_with_backoff(support_manager, caplog):
     """Test notify uses log_with_backoff."""
     integration_framework.utils.check_docstrings()
     caplog.set_level(logging.INFO)
-    with patch("time.time", return_value=1000.0):
+    with patch("time.monotonic", return_value=1000.0):
         result = support_manager.notify("Test notification", "test_integration")
         assert result is True
         assert "Test notification" in caplog.text
@@ -40,7 +40,7 @@ def test_report_issue_with_backoff(support_manager, caplog):
     """Test report_issue uses log_with_backoff."""
     integration_framework.utils.check_docstrings()
     caplog.set_level(logging.ERROR)
-    with patch("time.time", return_value=1000.0):
+    with patch("time.monotonic", return_value=1000.0):
         result = support_manager.report_issue("bug", "Test error", "test_integration")
         assert result is True
         assert "Issue in test_integration: Bug: Test error" in caplog.text
@@ -66,7 +66,7 @@ def test_report_issue(support_manager, caplog):
     """Test report_issue logs error and updates backoff state."""
     integration_framework.utils.check_docstrings()
     caplog.set_level(logging.ERROR)
-    with patch("time.time", return_value=1000.0):
+    with patch("time.monotonic", return_value=1000.0):
         result = support_manager.report_issue("bug", "Direct test error", "test_integration")
         assert result is True
         assert "Issue in test_integration: Bug: Direct test error" in caplog.text
@@ -83,4 +83,23 @@ def test_log(support_manager, caplog):
     caplog.set_level(logging.ERROR)
     result = support_manager.log("Test error message", level="error")
     assert result is True
-    assert "Test error message" in caplog.text
\ No newline at end of file
+    assert "Test error message" in caplog.text
+
+def test_backoff_window_tracks_settings(support_manager):
+    """Test the suppression window follows changes to the backoff settings."""
+    integration_framework.utils.check_docstrings()
+    support_manager.initial_delay = 5.0
+    support_manager.max_delay = 3.0
+    with patch("time.monotonic", return_value=100.0):
+        support_manager._try_log("key", "message", "info")
+    assert support_manager.backoff_state["key"] == 103.0
+
+def test_backoff_state_stores_deadlines(support_manager):
+    """Test a logged key is suppressed until its monotonic deadline."""
+    integration_framework.utils.check_docstrings()
+    support_manager.initial_delay = 5.0
+    with patch("time.monotonic", return_value=100.0):
+        assert support_manager._try_log("key", "message", "info") == (True, 100.0)
+    assert support_manager.backoff_state["key"] == 105.0
+    assert not support_manager._should_log("key", 104.9)
+    assert support_manager._should_log("key", 105.0)
@@ -0,0 +1,44 @@
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+def test_log_run_batches_rows(tmp_path):
+    from integration_framework.telemetry import TelemetryManager
+    telemetry = TelemetryManager(str(tmp_path / "telemetry.db"))
+    with patch.object(telemetry, "log_run_many", wraps=telemetry.log_run_many) as mock_many:
+        for i in range(5):
+            telemetry.log_run(f"integration_{i}", "success", 0.1)
+        telemetry.flush()
+        assert sum(len(call.args[0]) for call in mock_many.call_args_list) == 5
+        assert mock_many.call_count < 5
+    telemetry.close()
+    with sqlite3.connect(tmp_path / "telemetry.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM telemetry").fetchone()[0] == 5
+
+def test_close_drains_queue(tmp_path):
+    from integration_framework.telemetry import TelemetryManager
+    telemetry = TelemetryManager(str(tmp_path / "telemetry.db"))
+    telemetry.log_run("test", "failed", 0.5, "boom")
+    telemetry.close()
+    assert telemetry._writer is None
+    with sqlite3.connect(tmp_path / "telemetry.db") as conn:
+        assert conn.execute("SELECT status, error FROM telemetry").fetchall() == [("failed", "boom")]
+        timestamp = conn.execute("SELECT timestamp FROM telemetry").fetchone()[0]
+    assert abs(datetime.fromisoformat(timestamp) - datetime.now()) < timedelta(minutes=1)
+    assert timestamp == datetime.fromisoformat(timestamp).isoformat()
+
+def test_generate_report(tmp_path, monkeypatch):
+    from integration_framework.telemetry import TelemetryManager
+    monkeypatch.chdir(tmp_path)
+    telemetry = TelemetryManager(str(tmp_path / "telemetry.db"))
+    telemetry.log_run_many([
+        ("hello_world", "success", 1.0, "2025-04-01T10:00:00", None),
+        ("hello_world", "failed", 3.0, "2025-04-02T10:00:00", "boom"),
+        ("hello_world", "success", 1.0, "2025-05-01T10:00:00", None),
+    ])
+    telemetry.generate_report("2025-04")
+    report = (tmp_path / "output" / "telemetry_report_2025-04.csv").read_text().splitlines()
+    assert report == [
+        "integration_name,run_count,success_count,error_count,avg_duration",
+        "hello_world,2,1,1,2.0",
+    ]